@@ -0,0 +1 @@
+"""Analysis and plotting of the QAP benchmark results written by the Kotlin solvers."""
@@ -0,0 +1,213 @@
+import json
+import os
+import platform
+import tempfile
+import time
+from contextlib import contextmanager
+
+import numpy as np
+
+from .cache import (
+    build_cache,
+    group_data,
+    group_initial_final_data,
+    load_cached_results,
+)
+from .index import COST_TIME_FILE, INITIAL_FINAL_FILE, reset_index
+from .reader import load_results
+from .similarity import average_similarity
+
+INSTANCE_SIZES = [20, 30, 40, 50, 60, 80, 100, 150]
+COST_TIME_FUNCTIONS = [
+    "heuristic",
+    "localSearchGreedy",
+    "localSearchSteepest",
+    "randomWalk",
+    "randomSearch",
+    "simulatedAnnealing",
+    "tabuSearch",
+]
+INITIAL_FINAL_FUNCTIONS = ["localSearchGreedy", "localSearchSteepest"]
+
+
+def _permutation_json(permutation):
+    return "[" + ",".join(map(str, permutation.tolist())) + "]"
+
+
+def _solution_json(permutation, cost):
+    return f'{{"permutation":{_permutation_json(permutation)},"cost":{cost}}}'
+
+
+def _optimal_cost(instance_size):
+    """Cost scale of tai<n>b: roughly 1e8 at n = 20, growing with n^2."""
+    return int(1e8 * (instance_size / 20) ** 2)
+
+
+def generate_cost_time(
+    file_path,
+    instance_sizes=INSTANCE_SIZES,
+    runs=10,
+    function_names=COST_TIME_FUNCTIONS,
+    seed=0,
+):
+    """
+    Writes a synthetic cost-time results file with one GeneralResult line (Results.kt)
+    per instance and function: an optimal solution and `runs` BestCost entries whose
+    cost, time, iterations and evaluations grow with the instance size.
+    """
+    rng = np.random.default_rng(seed)
+    with open(file_path, "w") as f:
+        for instance_size in instance_sizes:
+            optimal_cost = _optimal_cost(instance_size)
+            optimal = _solution_json(rng.permutation(instance_size), optimal_cost)
+            for index, function_name in enumerate(function_names):
+                costs = (
+                    optimal_cost * (1 + rng.gamma(2.0, 0.02 * (index + 1), runs))
+                ).astype(np.int64)
+                iterations = rng.poisson(instance_size * (index + 1), runs)
+                evaluations = iterations * instance_size * (instance_size - 1) // 2
+                times = rng.poisson(evaluations / 1e5 + 1)
+                best_solutions = ",".join(
+                    f'{{"cost":{cost},"time":{elapsed},'
+                    f'"iterations":{iteration},"evaluations":{evaluation}}}'
+                    for cost, elapsed, iteration, evaluation in zip(
+                        costs.tolist(),
+                        times.tolist(),
+                        iterations.tolist(),
+                        evaluations.tolist(),
+                    )
+                )
+                f.write(
+                    f'{{"functionName":"{function_name}",'
+                    f'"instanceSize":{instance_size},'
+                    f'"optimalSolution":{optimal},'
+                    f'"bestSolutions":[{best_solutions}]}}\n'
+                )
+
+
+def generate_initial_final(
+    file_path,
+    instance_sizes=INSTANCE_SIZES,
+    runs=10,
+    function_names=INITIAL_FINAL_FUNCTIONS,
+    seed=0,
+):
+    """
+    Writes a synthetic initial-final results file with one InitialVsFinalResult line
+    (Results.kt) per instance and function. Final solutions are their initial one with
+    a few random swaps applied, so they share positions like real local search runs.
+    """
+    rng = np.random.default_rng(seed)
+    with open(file_path, "w") as f:
+        for instance_size in instance_sizes:
+            optimal_cost = _optimal_cost(instance_size)
+            for function_name in function_names:
+                initial = np.argsort(rng.random((runs, instance_size)), axis=1)
+                final = initial.copy()
+                rows = np.arange(runs)
+                for _ in range(instance_size // 2):
+                    i, j = rng.integers(0, instance_size, (2, runs))
+                    final[rows, i], final[rows, j] = final[rows, j], final[rows, i]
+                initial_costs = optimal_cost * (1 + rng.gamma(4.0, 0.1, runs))
+                final_costs = optimal_cost * (1 + rng.gamma(2.0, 0.02, runs))
+                pairs = ",".join(
+                    f'{{"initialSolution":{_solution_json(p, int(c))},'
+                    f'"finalSolution":{_solution_json(q, int(d))}}}'
+                    for p, q, c, d in zip(initial, final, initial_costs, final_costs)
+                )
+                f.write(
+                    f'{{"functionName":"{function_name}",'
+                    f'"initialVsFinals":[{pairs}],'
+                    f'"instanceSize":{instance_size}}}\n'
+                )
+
+
+@contextmanager
+def _timed(report, stage, **labels):
+    start = time.perf_counter()
+    yield
+    report.append(
+        {"stage": stage, **labels, "seconds": round(time.perf_counter() - start, 6)}
+    )
+
+
+def run_benchmark(
+    work_dir=None,
+    instance_sizes=INSTANCE_SIZES,
+    runs=10,
+    figures=True,
+    seed=0,
+):
+    """
+    Generates synthetic results in work_dir (a temporary directory by default), then
+    times every stage of the pipeline on them: streaming parse, cache build and load,
+    grouping, average similarity and each figure of render.ALL_FIGURES.
+    Returns the report as a dict.
+    """
+    from .render import ALL_FIGURES, render_figure
+
+    stages = []
+    work_dir = work_dir or tempfile.mkdtemp(prefix="analysis-benchmark-")
+    previous_dir = os.getcwd()
+    os.makedirs(os.path.join(work_dir, "results"), exist_ok=True)
+    os.makedirs(os.path.join(work_dir, "plots"), exist_ok=True)
+    os.chdir(work_dir)
+    reset_index()
+    try:
+        with _timed(stages, "generate", file=COST_TIME_FILE):
+            generate_cost_time(COST_TIME_FILE, instance_sizes, runs, seed=seed)
+        with _timed(stages, "generate", file=INITIAL_FINAL_FILE):
+            generate_initial_final(INITIAL_FINAL_FILE, instance_sizes, runs, seed=seed)
+
+        for file_path in [COST_TIME_FILE, INITIAL_FINAL_FILE]:
+            with _timed(stages, "load_results", file=file_path):
+                for _ in load_results(file_path):
+                    pass
+            with _timed(stages, "build_cache", file=file_path):
+                build_cache(file_path)
+            with _timed(stages, "load_cached_results", file=file_path):
+                table = load_cached_results(file_path)
+
+        with _timed(stages, "group_data", file=COST_TIME_FILE):
+            group_data(load_cached_results(COST_TIME_FILE))
+        with _timed(stages, "group_initial_final_data", file=INITIAL_FINAL_FILE):
+            initial_final = group_initial_final_data(table)
+
+        for instance_size, functions_data in initial_final.items():
+            for function_name, solutions in functions_data.items():
+                with _timed(
+                    stages,
+                    "average_similarity",
+                    instanceSize=instance_size,
+                    functionName=function_name,
+                ):
+                    average_similarity(solutions["finalSolution"]["permutation"])
+
+        if figures:
+            for figure in ALL_FIGURES:
+                with _timed(stages, "figure", output=figure.output):
+                    render_figure(figure)
+    finally:
+        os.chdir(previous_dir)
+        reset_index()
+
+    return {
+        "config": {
+            "instanceSizes": list(instance_sizes),
+            "runs": runs,
+            "seed": seed,
+            "workDir": work_dir,
+        },
+        "environment": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "machine": platform.machine(),
+            "cpus": os.cpu_count(),
+        },
+        "stages": stages,
+    }
+
+
+def write_report(report, file_path):
+    with open(file_path, "w") as f:
+        json.dump(report, f, indent=2)
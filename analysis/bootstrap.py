@@ -0,0 +1,124 @@
+import numpy as np
+
+from .profiling import stage
+from .stats import expected_best_of_k, scaled_distance
+
+STATISTICS = ["mean", "median", "best"]
+
+
+def _segment_medians(resampled, ranks, unique_values, offsets, sizes):
+    """
+    Medians of every segment of every row. Values are replaced by their global rank
+    and offset by segment index, so a single row-wise sort keeps segments contiguous.
+    """
+    total = resampled.shape[1]
+    segment_ids = np.repeat(np.arange(len(sizes)), sizes)
+    keys = np.sort(segment_ids * total + ranks, axis=1) - segment_ids * total
+    lower = unique_values[keys[:, offsets + (sizes - 1) // 2]]
+    upper = unique_values[keys[:, offsets + sizes // 2]]
+    return (lower + upper) / 2
+
+
+def bootstrap_intervals(
+    samples,
+    statistics=STATISTICS,
+    resamples=2000,
+    confidence=0.95,
+    k=None,
+    seed=0,
+    chunk_size=2**22,
+):
+    """
+    Percentile bootstrap confidence intervals for many groups at once.
+
+    `samples` maps any key to a 1-D array of values. All groups are concatenated and the
+    resample indices of every group are drawn as one (resamples, total) array, so each
+    statistic is a segment reduction over that array. "best" is the minimum of k draws
+    (k defaults to the group size). Returns {key: {statistic: (estimate, low, high)}}.
+    """
+    keys = list(samples)
+    values = [np.asarray(samples[key], dtype=np.float64) for key in keys]
+    sizes = np.array([len(value) for value in values])
+    if (sizes == 0).any():
+        raise ValueError("Cannot bootstrap an empty group")
+    offsets = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+    flat = np.concatenate(values)
+    total = len(flat)
+    unique_values, ranks = np.unique(flat, return_inverse=True)
+    position = np.arange(total) - np.repeat(offsets, sizes)
+    draws = sizes if k is None else np.minimum(sizes, k)
+    beyond_k = position >= np.repeat(draws, sizes)
+
+    rng = np.random.default_rng(seed)
+    distributions = {statistic: [] for statistic in statistics}
+    rows = max(1, chunk_size // total)
+    for start in range(0, resamples, rows):
+        count = min(rows, resamples - start)
+        indices = np.repeat(offsets, sizes) + (
+            rng.random((count, total)) * np.repeat(sizes, sizes)
+        ).astype(np.int64)
+        resampled = flat[indices]
+
+        if "mean" in statistics:
+            distributions["mean"].append(
+                np.add.reduceat(resampled, offsets, axis=1) / sizes
+            )
+        if "median" in statistics:
+            distributions["median"].append(
+                _segment_medians(
+                    resampled, ranks[indices], unique_values, offsets, sizes
+                )
+            )
+        if "best" in statistics:
+            distributions["best"].append(
+                np.minimum.reduceat(
+                    np.where(beyond_k, np.inf, resampled), offsets, axis=1
+                )
+            )
+
+    alpha = (1 - confidence) / 2
+    intervals = {key: {} for key in keys}
+    for statistic, chunks in distributions.items():
+        low, high = np.quantile(np.concatenate(chunks), [alpha, 1 - alpha], axis=0)
+        for index, key in enumerate(keys):
+            if statistic == "mean":
+                estimate = values[index].mean()
+            elif statistic == "median":
+                estimate = np.median(values[index])
+            else:
+                estimate = expected_best_of_k(values[index])[draws[index] - 1]
+            intervals[key][statistic] = (estimate, low[index], high[index])
+    return intervals
+
+
+def bootstrap_tables(
+    data_by_instance,
+    optimal_solutions,
+    measures=("distance", "time", "iterations", "evaluations"),
+    statistic="mean",
+    **kwargs,
+):
+    """
+    Bootstraps every (instance, function, measure) group in one batched pass and returns
+    {measure: {instance_size: {function_name: (estimate, low, high)}}}. The "distance"
+    measure is the scaled distance to the optimum and skips instances without one.
+    """
+    samples = {}
+    for instance_size, functions_data in data_by_instance.items():
+        for function_name, runs in functions_data.items():
+            for measure in measures:
+                if measure == "distance":
+                    if instance_size not in optimal_solutions:
+                        continue
+                    optimal_cost = optimal_solutions[instance_size]["cost"]
+                    values = scaled_distance(runs["cost"], optimal_cost)
+                else:
+                    values = runs[measure]
+                samples[(measure, instance_size, function_name)] = values
+
+    with stage("bootstrap", statistic=statistic, groups=len(samples)):
+        intervals = bootstrap_intervals(samples, [statistic], **kwargs)
+    tables = {measure: {} for measure in measures}
+    for (measure, instance_size, function_name), stats in intervals.items():
+        tables[measure].setdefault(instance_size, {})[function_name] = stats[statistic]
+    return tables
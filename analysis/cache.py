@@ -0,0 +1,267 @@
+import json
+import os
+from array import array
+from collections import defaultdict
+
+import numpy as np
+
+from .container import is_container, read_container
+from .profiling import stage
+from .records import InitialVsFinalResult, load_records
+
+CACHE_VERSION = 1
+MEASURES = ["cost", "time", "iterations", "evaluations"]
+SOLUTIONS = ["initialSolution", "finalSolution"]
+
+
+def cache_dir_for(file_path):
+    """Cache directory of a results file: results/.cache/<file name>/"""
+    directory, name = os.path.split(os.path.abspath(file_path))
+    return os.path.join(directory, ".cache", name)
+
+
+def _source_stamp(file_path):
+    stat = os.stat(file_path)
+    return {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+
+
+def _read_meta(cache_dir):
+    try:
+        with open(os.path.join(cache_dir, "meta.json")) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _collect_cost_time(results):
+    """Collects per-group column chunks from GeneralResult records (records.py)."""
+    chunks = defaultdict(lambda: defaultdict(list))
+    optimal_solutions = {}
+    for result in results:
+        key = (result.instanceSize, result.functionName)
+        runs = result.bestSolutions
+        for measure in MEASURES:
+            chunks[key][measure].append(
+                np.fromiter(
+                    (getattr(run, measure) for run in runs),
+                    dtype=np.int64,
+                    count=len(runs),
+                )
+            )
+        if result.optimalSolution is not None:
+            optimal_solutions[result.instanceSize] = {
+                "permutation": result.optimalSolution.permutation.tolist(),
+                "cost": result.optimalSolution.cost,
+            }
+    return chunks, optimal_solutions
+
+
+def _collect_initial_final(results):
+    """
+    Collects per-group column chunks from InitialVsFinalResult records (records.py). The
+    packed array('H') permutations of a record are joined into one buffer and viewed as
+    an (R, n) matrix without going through Python ints.
+    """
+    chunks = defaultdict(lambda: defaultdict(list))
+    for result in results:
+        key = (result.instanceSize, result.functionName)
+        runs = result.initialVsFinals
+        for solution in SOLUTIONS:
+            chunks[key][f"{solution}.cost"].append(
+                np.fromiter(
+                    (getattr(run, solution).cost for run in runs),
+                    dtype=np.int64,
+                    count=len(runs),
+                )
+            )
+            buffer = array("H")
+            for run in runs:
+                buffer.extend(getattr(run, solution).permutation)
+            permutations = np.frombuffer(buffer, dtype=np.uint16).reshape(
+                len(runs), result.instanceSize
+            )
+            chunks[key][f"{solution}.permutation"].append(permutations.astype(np.int16))
+    return chunks, {}
+
+
+def _concatenate(column, parts, width):
+    if column.endswith(".permutation"):
+        padded = np.full((sum(len(part) for part in parts), width), -1, dtype=np.int16)
+        row = 0
+        for part in parts:
+            padded[row : row + len(part), : part.shape[1]] = part
+            row += len(part)
+        return padded
+    return np.concatenate(parts) if parts else np.empty(0, dtype=np.int64)
+
+
+def _save_atomic(path, array):
+    """Writes an .npy file under a temporary name first so readers never see it partial."""
+    temporary_path = f"{path}.{os.getpid()}.tmp.npy"
+    np.save(temporary_path, array)
+    os.replace(temporary_path, path)
+
+
+def build_cache(file_path, cache_dir=None):
+    """
+    Converts a JSONL results file into one .npy file per column. Rows are ordered so that
+    every (instanceSize, functionName) group is a contiguous slice, in order of first
+    appearance in the source file.
+    """
+    cache_dir = cache_dir or cache_dir_for(file_path)
+    stamp = _source_stamp(file_path)
+
+    results = load_records(file_path)
+    first = next(results, None)
+    kind = "initialFinal" if isinstance(first, InitialVsFinalResult) else "costTime"
+    collect = _collect_initial_final if kind == "initialFinal" else _collect_cost_time
+
+    def records():
+        if first is not None:
+            yield first
+            yield from results
+
+    chunks, optimal_solutions = collect(records())
+    width = max((instance_size for instance_size, _ in chunks), default=0)
+
+    groups = []
+    row = 0
+    for (instance_size, function_name), columns in chunks.items():
+        count = sum(len(part) for part in next(iter(columns.values())))
+        groups.append([instance_size, function_name, row, row + count])
+        row += count
+
+    function_names = list(
+        dict.fromkeys(function_name for _, function_name, _, _ in groups)
+    )
+    column_names = (
+        [
+            f"{solution}.{field}"
+            for solution in SOLUTIONS
+            for field in ["cost", "permutation"]
+        ]
+        if kind == "initialFinal"
+        else MEASURES
+    )
+
+    os.makedirs(cache_dir, exist_ok=True)
+    meta_path = os.path.join(cache_dir, "meta.json")
+    try:
+        os.remove(meta_path)
+    except FileNotFoundError:
+        pass
+
+    for column in column_names:
+        parts = [part for columns in chunks.values() for part in columns[column]]
+        _save_atomic(
+            os.path.join(cache_dir, f"{column}.npy"), _concatenate(column, parts, width)
+        )
+
+    instance_codes = np.empty(row, dtype=np.int32)
+    function_codes = np.empty(row, dtype=np.int16)
+    for instance_size, function_name, start, stop in groups:
+        instance_codes[start:stop] = instance_size
+        function_codes[start:stop] = function_names.index(function_name)
+    _save_atomic(os.path.join(cache_dir, "instanceSize.npy"), instance_codes)
+    _save_atomic(os.path.join(cache_dir, "functionName.npy"), function_codes)
+
+    meta = {
+        "version": CACHE_VERSION,
+        "source": stamp,
+        "kind": kind,
+        "columns": column_names,
+        "functionNames": function_names,
+        "groups": groups,
+        "optimalSolutions": [
+            [size, solution] for size, solution in optimal_solutions.items()
+        ],
+    }
+    # Written last: a cache is only valid once every column is in place.
+    temporary_path = f"{meta_path}.{os.getpid()}.tmp"
+    with open(temporary_path, "w") as f:
+        json.dump(meta, f)
+    os.replace(temporary_path, meta_path)
+    return meta
+
+
+def _is_fresh(meta, file_path):
+    return (
+        meta is not None
+        and meta.get("version") == CACHE_VERSION
+        and meta.get("source") == _source_stamp(file_path)
+    )
+
+
+def cache_is_fresh(file_path, cache_dir=None):
+    """True if the JSONL file has a valid columnar cache, so loading it parses nothing."""
+    return _is_fresh(_read_meta(cache_dir or cache_dir_for(file_path)), file_path)
+
+
+def load_cached_results(file_path, cache_dir=None):
+    """
+    Returns the columnar form of a results file as memory-mapped arrays, rebuilding the
+    cache first when it is missing or the source file's mtime/size changed. Binary
+    containers (container.py) are read directly, without a cache.
+    """
+    if is_container(file_path):
+        with stage("read_container", file=file_path):
+            return {"source": _source_stamp(file_path), **read_container(file_path)}
+    cache_dir = cache_dir or cache_dir_for(file_path)
+    meta = _read_meta(cache_dir)
+    if not _is_fresh(meta, file_path):
+        with stage("build_cache", file=file_path):
+            meta = build_cache(file_path, cache_dir)
+
+    with stage("load_cached_results", file=file_path):
+        columns = {
+            column: np.load(os.path.join(cache_dir, f"{column}.npy"), mmap_mode="r")
+            for column in meta["columns"] + ["instanceSize", "functionName"]
+        }
+    return {**meta, "columns": columns}
+
+
+def group_data(table):
+    """
+    Groups cost-time columns by instance and function. Each group maps a measure name
+    to a slice of the underlying column (for the measures the table has columns for).
+    """
+    columns = table["columns"]
+    data_by_instance = defaultdict(dict)
+    for instance_size, function_name, start, stop in table["groups"]:
+        data_by_instance[instance_size][function_name] = {
+            measure: columns[measure][start:stop]
+            for measure in MEASURES
+            if measure in columns
+        }
+
+    optimal_solutions = {
+        instance_size: {
+            "permutation": np.asarray(solution["permutation"], dtype=np.int16),
+            "cost": solution["cost"],
+        }
+        for instance_size, solution in table["optimalSolutions"]
+    }
+    return data_by_instance, optimal_solutions
+
+
+def group_initial_final_data(table):
+    """
+    Groups initial-final columns by instance and function, mirroring the JSON layout:
+    runs["finalSolution"]["permutation"] is an (R, n) slice of the permutation matrix.
+    Fields the table has no column for are left out.
+    """
+    columns = table["columns"]
+    data_by_instance = defaultdict(dict)
+    for instance_size, function_name, start, stop in table["groups"]:
+        runs = {}
+        for solution in SOLUTIONS:
+            if f"{solution}.cost" in columns:
+                runs.setdefault(solution, {})["cost"] = columns[f"{solution}.cost"][
+                    start:stop
+                ]
+            if f"{solution}.permutation" in columns:
+                runs.setdefault(solution, {})["permutation"] = columns[
+                    f"{solution}.permutation"
+                ][start:stop, :instance_size]
+        data_by_instance[instance_size][function_name] = runs
+    return data_by_instance
@@ -0,0 +1,478 @@
+import argparse
+import os
+
+from . import profiling
+from .cache import group_data, group_initial_final_data, load_cached_results
+from .container import COMPRESSORS, convert_results
+from .delta import local_optimality_audit
+from .index import COST_TIME_FILE, INITIAL_FINAL_FILE, set_sources
+from .ingest import expand_paths, ingest_files
+from .online import aggregate_results, aggregate_table
+from .line_index import query_lines, select_entries
+from .partitions import partition_results
+from .qap import verify_costs
+from .regression import MIN_EFFECT, regression_report
+from .stats import distance_table, format_table, measure_table
+
+MEASURES = ["distance", "time", "iterations", "evaluations"]
+
+
+def summary_tables(
+    file_paths,
+    measures=MEASURES,
+    only_search=False,
+    streaming=False,
+    jobs=1,
+    instance_sizes=None,
+    function_names=None,
+):
+    """
+    Per-instance/per-function mean and std tables of one or more cost-time results files
+    (paths, glob patterns or partitioned directories, merged), optionally limited to
+    some instances and functions. Only the columns the measures need are loaded. With
+    streaming set, the files are aggregated record by record instead of through the cache.
+    """
+    file_paths = expand_paths(
+        [file_paths] if isinstance(file_paths, str) else file_paths
+    )
+    if streaming:
+        aggregates = aggregate_results(
+            file_paths,
+            measures,
+            instance_sizes=instance_sizes,
+            function_names=function_names,
+        )
+        return {
+            measure: aggregate_table(
+                aggregates, measure, only_search and measure == "distance"
+            )
+            for measure in measures
+        }
+    grouping = load_grouping(file_paths, measures, jobs, instance_sizes, function_names)
+    return grouped_tables(grouping, measures, only_search)
+
+
+def load_grouping(
+    file_paths, measures=MEASURES, jobs=1, instance_sizes=None, function_names=None
+):
+    """group_data of one or more cost-time files, loading only the needed columns."""
+    columns = {"cost" if measure == "distance" else measure for measure in measures}
+    return group_data(
+        ingest_files(
+            expand_paths([file_paths] if isinstance(file_paths, str) else file_paths),
+            jobs,
+            instance_sizes,
+            function_names,
+            columns,
+        )
+    )
+
+
+def grouped_tables(grouping, measures=MEASURES, only_search=False):
+    """Mean and std tables of every measure from a group_data grouping."""
+    data_by_instance, optimal_solutions = grouping
+    tables = {}
+    for measure in measures:
+        if measure == "distance":
+            tables[measure] = distance_table(
+                data_by_instance, optimal_solutions, only_search
+            )
+        else:
+            tables[measure] = measure_table(data_by_instance, measure)
+    return tables
+
+
+def stats(args):
+    tables = summary_tables(
+        args.results,
+        args.measure,
+        args.only_search,
+        args.streaming,
+        args.jobs,
+        args.instances,
+        args.solvers,
+    )
+    for measure, table in tables.items():
+        title = "scaled distance" if measure == "distance" else measure
+        print(format_table(table, f"{title} (mean ± std)"))
+        print()
+
+
+def plot(args):
+    from .render import ALL_FIGURES, COST_TIME_FIGURES, INITIAL_FINAL_FIGURES
+    from .render import render_figures
+
+    figures = {
+        "all": ALL_FIGURES,
+        "cost-time": COST_TIME_FIGURES,
+        "initial-final": INITIAL_FINAL_FIGURES,
+    }[args.figures]
+    # Stages recorded in worker processes would be lost, so profile in-process.
+    jobs = 1 if profiling.enabled() else args.jobs
+    set_sources(args.cost_time, args.initial_final, jobs, args.instances, args.solvers)
+    render_figures(figures, jobs, args.force)
+
+
+def compare(args):
+    baseline_grouping = load_grouping(args.baseline, args.measure)
+    candidate_grouping = load_grouping(args.candidate, args.measure)
+    baseline = grouped_tables(baseline_grouping, args.measure)
+    candidate = grouped_tables(candidate_grouping, args.measure)
+    for measure in args.measure:
+        table = {}
+        for instance_size, functions in candidate[measure].items():
+            for function_name, (mean, _) in functions.items():
+                if function_name not in baseline[measure].get(instance_size, {}):
+                    continue
+                baseline_mean = baseline[measure][instance_size][function_name][0]
+                table.setdefault(instance_size, {})[function_name] = (
+                    baseline_mean,
+                    mean,
+                )
+        title = "scaled distance" if measure == "distance" else measure
+        print(format_table(table, f"{title} (baseline → candidate)", separator="→"))
+        print()
+
+    report = regression_report(
+        baseline_grouping,
+        candidate_grouping,
+        args.measure,
+        args.alpha,
+        args.min_effect,
+    )
+    print(
+        f"{'instance':>8}  {'function':<22}{'measure':<13}{'baseline':>14}"
+        f"{'candidate':>14}{'delta':>8}{'p worse':>10}{'p better':>10}  status"
+    )
+    for entry in report:
+        print(
+            f"{entry['instanceSize']:>8}  {entry['functionName']:<22}"
+            f"{entry['measure']:<13}{entry['baselineMedian']:>14.6g}"
+            f"{entry['candidateMedian']:>14.6g}{entry['cliffsDelta']:>8.2f}"
+            f"{entry['pGreater']:>10.3g}{entry['pLess']:>10.3g}  {entry['status']}"
+        )
+    regressions = sum(entry["status"] == "REGRESSION" for entry in report)
+    print(f"{regressions} significant regressions in {len(report)} comparisons")
+    return 1 if regressions else 0
+
+
+def watch(args):
+    from .watch import watch as watch_results
+
+    try:
+        watch_results(args.results, interval=args.interval, polls=args.polls)
+    except KeyboardInterrupt:
+        pass
+
+
+def benchmark(args):
+    from .benchmark import run_benchmark, write_report
+
+    report = run_benchmark(args.work_dir, args.sizes, args.runs, not args.no_figures)
+    write_report(report, args.output)
+    for entry in report["stages"]:
+        labels = "  ".join(
+            str(value)
+            for key, value in entry.items()
+            if key not in ("stage", "seconds")
+        )
+        print(f"{entry['stage']:<26}{entry['seconds']:>10.3f} s  {labels}")
+    print(f"report written to {args.output}")
+
+
+def query(args):
+    if not args.list:
+        for line in query_lines(args.results, args.instances, args.solvers):
+            print(line.decode().rstrip("\n"))
+        return
+    entries, function_names = select_entries(args.results, args.instances, args.solvers)
+    print(f"{'offset':>12}{'bytes':>12}{'instance':>10}  {'function':<22}{'runs':>8}")
+    for offset, length, instance_size, function_code, runs in entries.tolist():
+        print(
+            f"{offset:>12}{length:>12}{instance_size:>10}  "
+            f"{function_names[function_code]:<22}{runs:>8}"
+        )
+
+
+def partition(args):
+    catalog = partition_results(args.source, args.directory)
+    print(
+        f"{len(catalog['partitions'])} partitions of {args.source} written to "
+        f"{args.directory}"
+    )
+
+
+def convert(args):
+    source_size, target_size = convert_results(
+        args.source, args.target, args.compression
+    )
+    print(
+        f"{args.source} ({source_size} bytes) -> {args.target} ({target_size} bytes, "
+        f"{target_size / source_size:.1%})"
+    )
+
+
+def verify(args):
+    table = load_cached_results(args.results)
+    if table["kind"] == "initialFinal":
+        report = verify_costs(group_initial_final_data(table), input_dir=args.input_dir)
+    else:
+        _, optimal_solutions = group_data(table)
+        report = verify_costs({}, optimal_solutions, input_dir=args.input_dir)
+
+    failed = False
+    for entry in report:
+        if "error" in entry:
+            failed = True
+            print(f"{entry['instanceSize']:>6}  {entry['error']}")
+            continue
+        status = "ok" if not entry["drifting"] else "DRIFT"
+        failed = failed or bool(entry["drifting"])
+        print(
+            f"{entry['instanceSize']:>6}  {entry['functionName']:<22}"
+            f"{entry['solution']:<17}{entry['checked']:>8} checked  "
+            f"{len(entry['drifting']):>6} drifting  max drift {entry['maxDrift']:<12}"
+            f"{status}"
+        )
+    return 1 if failed else 0
+
+
+def audit(args):
+    data_by_instance = group_initial_final_data(load_cached_results(args.results))
+    report = local_optimality_audit(data_by_instance, args.input_dir, args.solution)
+    print(
+        f"{'instance':>8}  {'function':<22}{'local optima':>14}{'mean improving':>16}"
+        f"{'max improving':>15}{'best delta':>14}{'16n sample miss':>17}"
+    )
+    for entry in report:
+        print(
+            f"{entry['instanceSize']:>8}  {entry['functionName']:<22}"
+            f"{entry['localOptima']:>7} / {entry['runs']:<4}"
+            f"{entry['meanImprovingMoves']:>16.2f}{entry['maxImprovingMoves']:>15}"
+            f"{entry['bestImprovement']:>14}{entry['sampleMissProbability']:>17.3f}"
+        )
+    return 1 if any(entry["localOptima"] < entry["runs"] for entry in report) else 0
+
+
+def add_filter_arguments(parser):
+    parser.add_argument(
+        "--instances",
+        nargs="+",
+        type=int,
+        metavar="N",
+        help="only load these instance sizes",
+    )
+    parser.add_argument(
+        "--solvers",
+        nargs="+",
+        metavar="FUNCTION",
+        help="only load these functions (e.g. tabuSearch)",
+    )
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m analysis", description="Analyse QAP benchmark results."
+    )
+    parser.add_argument(
+        "--profile",
+        metavar="FILE",
+        help="record wall/CPU time and peak memory per stage and write them as JSON",
+    )
+    parser.add_argument(
+        "--cprofile-figure",
+        metavar="OUTPUT",
+        help="run one figure (e.g. plots/similarity.png) under cProfile",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    stats_parser = commands.add_parser(
+        "stats", help="print mean/std tables without plotting"
+    )
+    stats_parser.add_argument(
+        "--results",
+        nargs="+",
+        default=[COST_TIME_FILE],
+        help="results files or glob patterns, merged (e.g. 'results/cost-time-results*.txt')",
+    )
+    stats_parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="number of processes parsing results files (default: number of CPUs)",
+    )
+    stats_parser.add_argument(
+        "--measure", nargs="+", choices=MEASURES, default=MEASURES
+    )
+    stats_parser.add_argument(
+        "--only-search",
+        action="store_true",
+        help="leave out randomWalk, randomSearch and heuristic from scaled distance",
+    )
+    stats_parser.add_argument(
+        "--streaming",
+        action="store_true",
+        help="aggregate record by record in constant memory instead of via the cache",
+    )
+    add_filter_arguments(stats_parser)
+    stats_parser.set_defaults(handler=stats)
+
+    plot_parser = commands.add_parser("plot", help="render figures into plots/")
+    plot_parser.add_argument(
+        "--figures", choices=["all", "cost-time", "initial-final"], default="all"
+    )
+    plot_parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="number of worker processes (default: number of CPUs)",
+    )
+    plot_parser.add_argument(
+        "--cost-time",
+        nargs="+",
+        metavar="PATTERN",
+        help=f"cost-time results files or glob patterns (default: {COST_TIME_FILE})",
+    )
+    plot_parser.add_argument(
+        "--initial-final",
+        nargs="+",
+        metavar="PATTERN",
+        help=f"initial-final results files or glob patterns (default: {INITIAL_FINAL_FILE})",
+    )
+    plot_parser.add_argument(
+        "--force",
+        action="store_true",
+        help="redraw every figure even if its inputs are unchanged",
+    )
+    add_filter_arguments(plot_parser)
+    plot_parser.set_defaults(handler=plot)
+
+    compare_parser = commands.add_parser(
+        "compare",
+        help="compare two cost-time results files and fail on significant regressions",
+    )
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("candidate")
+    compare_parser.add_argument(
+        "--measure",
+        nargs="+",
+        choices=MEASURES,
+        default=["time", "evaluations", "distance"],
+    )
+    compare_parser.add_argument(
+        "--alpha",
+        type=float,
+        default=0.05,
+        help="significance level after Holm correction (default: 0.05)",
+    )
+    compare_parser.add_argument(
+        "--min-effect",
+        type=float,
+        default=MIN_EFFECT,
+        help=f"smallest Cliff's delta counted as a regression (default: {MIN_EFFECT})",
+    )
+    compare_parser.set_defaults(handler=compare)
+
+    watch_parser = commands.add_parser(
+        "watch",
+        help="follow a running cost-time benchmark and redraw figures as results arrive",
+    )
+    watch_parser.add_argument("--results", default=COST_TIME_FILE)
+    watch_parser.add_argument(
+        "--interval", type=float, default=5.0, help="seconds between polls"
+    )
+    watch_parser.add_argument(
+        "--polls", type=int, default=None, help="stop after this many polls"
+    )
+    watch_parser.set_defaults(handler=watch)
+
+    benchmark_parser = commands.add_parser(
+        "benchmark", help="time the analysis pipeline on synthetic results files"
+    )
+    benchmark_parser.add_argument(
+        "--sizes", nargs="+", type=int, default=[20, 30, 40, 50, 60, 80, 100, 150]
+    )
+    benchmark_parser.add_argument(
+        "--runs", type=int, default=10, help="runs per instance and function"
+    )
+    benchmark_parser.add_argument(
+        "--work-dir",
+        help="where to generate the files (default: a temporary directory)",
+    )
+    benchmark_parser.add_argument("--output", default="benchmark-report.json")
+    benchmark_parser.add_argument(
+        "--no-figures", action="store_true", help="skip timing the figure functions"
+    )
+    benchmark_parser.set_defaults(handler=benchmark)
+
+    query_parser = commands.add_parser(
+        "query",
+        help="print the JSON lines of some instances/functions via the line index",
+    )
+    query_parser.add_argument("--results", default=COST_TIME_FILE)
+    query_parser.add_argument(
+        "--list",
+        action="store_true",
+        help="list the matching index entries instead of printing the lines",
+    )
+    add_filter_arguments(query_parser)
+    query_parser.set_defaults(handler=query)
+
+    partition_parser = commands.add_parser(
+        "partition",
+        help="write a results file as one directory per instance and function",
+    )
+    partition_parser.add_argument("source")
+    partition_parser.add_argument("directory")
+    partition_parser.set_defaults(handler=partition)
+
+    convert_parser = commands.add_parser(
+        "convert",
+        help="convert a JSONL results file into the compressed binary container",
+    )
+    convert_parser.add_argument("source")
+    convert_parser.add_argument("target")
+    convert_parser.add_argument(
+        "--compression", choices=list(COMPRESSORS), default="lzma"
+    )
+    convert_parser.set_defaults(handler=convert)
+
+    verify_parser = commands.add_parser(
+        "verify", help="recompute stored permutation costs from the instance files"
+    )
+    verify_parser.add_argument("--results", default=INITIAL_FINAL_FILE)
+    verify_parser.add_argument("--input-dir", default="input")
+    verify_parser.set_defaults(handler=verify)
+
+    audit_parser = commands.add_parser(
+        "audit", help="check that reported solutions are 2-swap local optima"
+    )
+    audit_parser.add_argument("--results", default=INITIAL_FINAL_FILE)
+    audit_parser.add_argument("--input-dir", default="input")
+    audit_parser.add_argument(
+        "--solution",
+        choices=["initialSolution", "finalSolution"],
+        default="finalSolution",
+    )
+    audit_parser.set_defaults(handler=audit)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.cprofile_figure:
+        profiling.profile_output(args.cprofile_figure)
+    if not args.profile:
+        return args.handler(args)
+
+    profiling.enable()
+    try:
+        with profiling.stage("command", command=args.command):
+            return args.handler(args)
+    finally:
+        profiling.write_records(args.profile)
+        print(profiling.format_records())
+        print(f"profile written to {args.profile}")
@@ -0,0 +1,198 @@
+import json
+import lzma
+import os
+import struct
+import zlib
+
+import numpy as np
+
+MAGIC = b"QAPRES\x01\n"
+COMPRESSORS = {
+    "lzma": (lzma.compress, lzma.decompress),
+    "zlib": (lambda data: zlib.compress(data, 9), zlib.decompress),
+}
+_INTEGER_TYPES = [np.int8, np.int16, np.int32, np.int64]
+
+
+def is_container(file_path):
+    """True if the file starts with the binary results container magic."""
+    try:
+        with open(file_path, "rb") as f:
+            return f.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+
+def _narrowest(values):
+    """Smallest signed integer dtype holding every value of a column."""
+    if not values.size:
+        return np.dtype(np.int8)
+    low, high = values.min(), values.max()
+    for dtype in _INTEGER_TYPES:
+        info = np.iinfo(dtype)
+        if info.min <= low and high <= info.max:
+            return np.dtype(dtype)
+    return values.dtype
+
+
+def _packed_permutations(column, groups):
+    """
+    Rows of a padded permutation column without the -1 padding, group by group, as
+    uint8 when every instance has at most 256 facilities and uint16 otherwise.
+    """
+    width = max((instance_size for instance_size, _, _, _ in groups), default=0)
+    dtype = np.uint8 if width <= 256 else np.uint16
+    parts = [
+        np.asarray(column[start:stop, :instance_size], dtype=dtype).ravel()
+        for instance_size, _, start, stop in groups
+    ]
+    return np.concatenate(parts) if parts else np.empty(0, dtype=dtype)
+
+
+def write_container(table, file_path, compression="lzma"):
+    """
+    Writes a columnar results table (the load_cached_results format) as one binary file:
+    the magic, a length-prefixed JSON header, then every column compressed on its own.
+    Measure columns are stored at the narrowest integer width that fits and permutations
+    as packed uint8/uint16 rows.
+    """
+    compress = COMPRESSORS[compression][0]
+    payloads = []
+    columns = []
+    for name in table["columns"]:
+        if name in ("instanceSize", "functionName"):
+            continue
+        column = np.asarray(table["columns"][name])
+        if name.endswith(".permutation"):
+            stored = _packed_permutations(column, table["groups"])
+        else:
+            stored = column.astype(_narrowest(column))
+        payload = compress(np.ascontiguousarray(stored).tobytes())
+        payloads.append(payload)
+        columns.append(
+            {
+                "name": name,
+                "dtype": column.dtype.str,
+                "shape": list(column.shape),
+                "storedDtype": stored.dtype.str,
+                "bytes": len(payload),
+            }
+        )
+
+    header = json.dumps(
+        {
+            "kind": table["kind"],
+            "compression": compression,
+            "functionNames": table["functionNames"],
+            "groups": table["groups"],
+            "optimalSolutions": table["optimalSolutions"],
+            "columns": columns,
+        }
+    ).encode()
+    with open(file_path, "wb") as f:
+        f.write(MAGIC)
+        f.write(struct.pack("<I", len(header)))
+        f.write(header)
+        for payload in payloads:
+            f.write(payload)
+
+
+def read_container(file_path):
+    """
+    Reads a binary results container back into the load_cached_results format, with
+    the columns as in-memory arrays. No JSON is parsed apart from the header.
+    """
+    with open(file_path, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"Not a results container: {file_path}")
+        (header_size,) = struct.unpack("<I", f.read(4))
+        header = json.loads(f.read(header_size))
+        decompress = COMPRESSORS[header["compression"]][1]
+        payloads = [f.read(column["bytes"]) for column in header["columns"]]
+
+    groups = header["groups"]
+    columns = {}
+    for column, payload in zip(header["columns"], payloads):
+        stored = np.frombuffer(decompress(payload), dtype=column["storedDtype"])
+        if column["name"].endswith(".permutation"):
+            values = np.full(column["shape"], -1, dtype=column["dtype"])
+            offset = 0
+            for instance_size, _, start, stop in groups:
+                size = (stop - start) * instance_size
+                values[start:stop, :instance_size] = stored[
+                    offset : offset + size
+                ].reshape(stop - start, instance_size)
+                offset += size
+        else:
+            values = stored.astype(column["dtype"])
+        columns[column["name"]] = values
+
+    rows = groups[-1][3] if groups else 0
+    columns["instanceSize"] = np.empty(rows, dtype=np.int32)
+    columns["functionName"] = np.empty(rows, dtype=np.int16)
+    for instance_size, function_name, start, stop in groups:
+        columns["instanceSize"][start:stop] = instance_size
+        columns["functionName"][start:stop] = header["functionNames"].index(
+            function_name
+        )
+    return {
+        "kind": header["kind"],
+        "columns": columns,
+        "functionNames": header["functionNames"],
+        "groups": groups,
+        "optimalSolutions": header["optimalSolutions"],
+    }
+
+
+def container_records(file_path):
+    """
+    Yields one JSON-shaped record per (instanceSize, functionName) group of a container,
+    as reader.load_results does for JSONL, so streaming consumers accept both formats.
+    """
+    table = read_container(file_path)
+    columns = table["columns"]
+    optimal_solutions = dict(table["optimalSolutions"])
+    for instance_size, function_name, start, stop in table["groups"]:
+        if table["kind"] == "initialFinal":
+            solutions = {
+                solution: (
+                    columns[f"{solution}.permutation"][start:stop, :instance_size],
+                    columns[f"{solution}.cost"][start:stop],
+                )
+                for solution in ["initialSolution", "finalSolution"]
+            }
+            yield {
+                "functionName": function_name,
+                "initialVsFinals": [
+                    {
+                        solution: {
+                            "permutation": permutations[row].tolist(),
+                            "cost": int(costs[row]),
+                        }
+                        for solution, (permutations, costs) in solutions.items()
+                    }
+                    for row in range(stop - start)
+                ],
+                "instanceSize": instance_size,
+            }
+        else:
+            measures = ["cost", "time", "iterations", "evaluations"]
+            yield {
+                "functionName": function_name,
+                "instanceSize": instance_size,
+                "optimalSolution": optimal_solutions.get(instance_size),
+                "bestSolutions": [
+                    dict(zip(measures, values))
+                    for values in zip(
+                        *(columns[measure][start:stop].tolist() for measure in measures)
+                    )
+                ],
+            }
+
+
+def convert_results(source_path, target_path, compression="lzma"):
+    """Converts a JSONL results file into a binary container; returns both sizes."""
+    from .cache import load_cached_results
+
+    write_container(load_cached_results(source_path), target_path, compression)
+    return os.path.getsize(source_path), os.path.getsize(target_path)
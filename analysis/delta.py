@@ -0,0 +1,180 @@
+import numpy as np
+
+from .qap import DEFAULT_MEMORY_BUDGET, load_instance
+
+TABU_SAMPLE_FACTOR = 16
+TABU_OUTER_SAMPLES = 256
+
+
+def delta_matrices(permutations, distance_matrix, flow_matrix):
+    """
+    Cost change of every 2-swap for a (B, n) batch of permutations, as a (B, n, n) array
+    whose [b, r, s] entry equals Solution.getDeltaCost(r, s) plus the terms for the
+    swapped pair itself (zero on the usual zero-diagonal, symmetric Taillard instances).
+
+    With A[i, j] = flow[p[i], p[j]] and D the distance matrix, the sums over k in
+    getDeltaCost become entries of A @ D.T and A.T @ D, minus the k = r, s terms.
+    """
+    permutations = np.asarray(permutations, dtype=np.intp)
+    A = np.asarray(flow_matrix, dtype=np.int64)[
+        permutations[:, :, None], permutations[:, None, :]
+    ]
+    D = np.asarray(distance_matrix, dtype=np.int64)[None, :, :]
+    At = A.transpose(0, 2, 1)
+    Dt = D.transpose(0, 2, 1)
+    a = np.diagonal(A, axis1=1, axis2=2)
+    d = np.diagonal(D, axis1=1, axis2=2)
+    a_r, a_s = a[:, :, None], a[:, None, :]
+    d_r, d_s = d[:, :, None], d[:, None, :]
+
+    M = A @ Dt
+    N = At @ D
+    m = np.diagonal(M, axis1=1, axis2=2)
+    n_diagonal = np.diagonal(N, axis1=1, axis2=2)
+    rows_term = M + M.transpose(0, 2, 1) - m[:, :, None] - m[:, None, :]
+    columns_term = (
+        N + N.transpose(0, 2, 1) - n_diagonal[:, :, None] - n_diagonal[:, None, :]
+    )
+
+    excluded = (
+        (At - a_r) * (d_r - Dt)
+        + (a_s - A) * (D - d_s)
+        + (A - a_r) * (d_r - D)
+        + (a_s - At) * (Dt - d_s)
+    )
+    pair = (a_s - a_r) * (d_r - d_s) + (At - A) * (D - Dt)
+    deltas = rows_term + columns_term - excluded + pair
+
+    diagonal = np.arange(permutations.shape[1])
+    deltas[:, diagonal, diagonal] = 0
+    return deltas
+
+
+def tabu_sample_plan(n, sample_size, samples=TABU_OUTER_SAMPLES, seed=0):
+    """
+    Which moves tabuSearch evaluates: the first sample_size items of
+    Solution.getNeighbourhoodWithMoves, which walks the rows i in a shuffled outer order
+    and, within a row, every j > i in one shared shuffled inner order. For `samples`
+    random outer orders, returns the rows whose moves are all taken ((samples, n) bool),
+    the row where the sample stops (-1 if it takes every move) and how many of that
+    row's moves it takes.
+    """
+    order = np.argsort(np.random.default_rng(seed).random((samples, n)), axis=1)
+    lengths = n - 1 - order
+    ends = np.cumsum(lengths, axis=1)
+    in_full = ends <= sample_size
+    covered = np.zeros((samples, n), dtype=bool)
+    np.put_along_axis(covered, order, in_full, axis=1)
+
+    position = np.minimum(in_full.sum(axis=1), n - 1)[:, None]
+    has_partial = ~in_full.all(axis=1)
+    partial = np.where(
+        has_partial, np.take_along_axis(order, position, axis=1)[:, 0], -1
+    )
+    start = (np.take_along_axis(ends - lengths, position, axis=1))[:, 0]
+    taken = np.where(has_partial, sample_size - start, 0)
+    return covered, partial, taken
+
+
+def tabu_miss_probability(row_improving, plan):
+    """
+    Probability that tabuSearch's sample (a tabu_sample_plan) contains no improving
+    move, for an (R, n) array counting the improving moves (i, j > i) of every row i.
+    The outer order is averaged over the plan's samples; the inner order restricted to
+    the stopping row is uniform, so its miss probability is the exact hypergeometric
+    one. NaN at a local optimum, where there is nothing to miss.
+    """
+    covered, partial, taken = plan
+    row_improving = np.asarray(row_improving, dtype=np.int64)
+    n = row_improving.shape[1]
+    full_hit = (row_improving > 0).astype(np.int32) @ covered.T.astype(np.int32) > 0
+
+    row = np.maximum(partial, 0)
+    length = np.where(partial >= 0, n - 1 - row, 0)
+    improving = np.where(partial >= 0, row_improving[:, row], 0)
+    clean = length - improving
+    log_factorials = np.concatenate([[0.0], np.cumsum(np.log(np.arange(1, n + 1)))])
+    possible = taken <= clean
+    log_miss = (
+        log_factorials[clean]
+        - log_factorials[np.where(possible, clean - taken, 0)]
+        - log_factorials[length]
+        + log_factorials[length - taken]
+    )
+    partial_miss = np.where(possible, np.exp(np.where(possible, log_miss, 0)), 0.0)
+    miss = np.where(full_hit, 0.0, partial_miss).mean(axis=1)
+    return np.where(row_improving.sum(axis=1) > 0, miss, np.nan)
+
+
+def audit_permutations(
+    permutations,
+    distance_matrix,
+    flow_matrix,
+    memory_budget=DEFAULT_MEMORY_BUDGET,
+    plan=None,
+):
+    """
+    Number of improving 2-swaps left and the best available improvement (most negative
+    delta, 0 at a local optimum) for every row of an (R, n) permutation array, plus the
+    tabu_miss_probability of every row for a tabu_sample_plan (NaN without one).
+    """
+    permutations = np.asarray(permutations)
+    rows, n = permutations.shape
+    batch_size = max(1, memory_budget // (12 * 8 * n * n))
+    upper = np.triu(np.ones((n, n), dtype=bool), k=1)
+    improving = np.empty(rows, dtype=np.int64)
+    best = np.empty(rows, dtype=np.int64)
+    miss = np.full(rows, np.nan)
+    for start in range(0, rows, batch_size):
+        deltas = delta_matrices(
+            permutations[start : start + batch_size], distance_matrix, flow_matrix
+        )
+        stop = start + len(deltas)
+        row_improving = ((deltas < 0) & upper).sum(axis=2)
+        improving[start:stop] = row_improving.sum(axis=1)
+        best[start:stop] = np.minimum(deltas[:, upper].min(axis=1), 0)
+        if plan is not None:
+            miss[start:stop] = tabu_miss_probability(row_improving, plan)
+    return improving, best, miss
+
+
+def local_optimality_audit(
+    data_by_instance,
+    input_dir="input",
+    solution="finalSolution",
+    memory_budget=DEFAULT_MEMORY_BUDGET,
+):
+    """
+    Audits the reported solutions of every (instance, function) group of an initial-final
+    grouping. Each entry gives the share of runs that are true 2-swap local optima, the
+    mean and maximum number of improving moves left, the best improvement available,
+    and the mean probability that tabuSearch's sample of 16 * n moves, drawn the way
+    Solution.getNeighbourhoodWithMoves orders them, misses every improving move.
+    """
+    report = []
+    for instance_size, functions_data in data_by_instance.items():
+        distance_matrix, flow_matrix = load_instance(instance_size, input_dir)
+        plan = tabu_sample_plan(instance_size, TABU_SAMPLE_FACTOR * instance_size)
+        for function_name, runs in functions_data.items():
+            improving, best, miss = audit_permutations(
+                runs[solution]["permutation"],
+                distance_matrix,
+                flow_matrix,
+                memory_budget,
+                plan,
+            )
+            report.append(
+                {
+                    "instanceSize": instance_size,
+                    "functionName": function_name,
+                    "runs": len(improving),
+                    "localOptima": int((improving == 0).sum()),
+                    "meanImprovingMoves": float(improving.mean()),
+                    "maxImprovingMoves": int(improving.max()),
+                    "bestImprovement": int(best.min()),
+                    "sampleMissProbability": (
+                        float(np.nanmean(miss)) if improving.any() else np.nan
+                    ),
+                }
+            )
+    return report
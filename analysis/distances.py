@@ -0,0 +1,120 @@
+import numpy as np
+
+from .similarity import average_similarity
+
+DEFAULT_PAIR_BUDGET = 2**22
+
+
+def inverse(permutations):
+    """Row-wise inverse of an (R, n) permutation array: inverse[r, p[r, i]] = i."""
+    permutations = np.asarray(permutations, dtype=np.intp)
+    rows, n = permutations.shape
+    inverted = np.empty_like(permutations)
+    np.put_along_axis(
+        inverted, permutations, np.broadcast_to(np.arange(n), (rows, n)), axis=1
+    )
+    return inverted
+
+
+def positional_similarity(p, q):
+    """Fraction of positions where p and q agree, row by row."""
+    return (np.asarray(p) == np.asarray(q)).mean(axis=1)
+
+
+def hamming_distance(p, q):
+    """Number of positions where p and q differ, row by row."""
+    return (np.asarray(p) != np.asarray(q)).sum(axis=1)
+
+
+def cycle_counts(permutations):
+    """
+    Number of cycles of every row of an (R, n) permutation array. Each element is
+    labelled with the smallest index on its cycle by pointer doubling, so the count is
+    the number of elements that are their own label; no Python loop over elements.
+    """
+    successor = np.array(permutations, dtype=np.intp)
+    rows, n = successor.shape
+    labels = np.broadcast_to(np.arange(n), (rows, n)).copy()
+    for _ in range(max(1, int(np.ceil(np.log2(max(n, 2)))))):
+        labels = np.minimum(labels, np.take_along_axis(labels, successor, axis=1))
+        successor = np.take_along_axis(successor, successor, axis=1)
+    return (labels == np.arange(n)).sum(axis=1)
+
+
+def swap_distance(p, q):
+    """
+    Minimum number of swaps turning p into q, row by row: n minus the number of cycles
+    of p^-1 o q.
+    """
+    p = np.asarray(p, dtype=np.intp)
+    q = np.asarray(q, dtype=np.intp)
+    composed = np.take_along_axis(inverse(p), q, axis=1)
+    return p.shape[1] - cycle_counts(composed)
+
+
+def adjacency_overlap(p, q):
+    """
+    Fraction of facility pairs placed on neighbouring locations in p that are also on
+    neighbouring locations in q, row by row.
+    """
+    p = np.asarray(p, dtype=np.intp)
+    q_positions = inverse(q)
+    positions = np.take_along_axis(q_positions, p, axis=1)
+    return (np.abs(np.diff(positions, axis=1)) == 1).mean(axis=1)
+
+
+METRICS = {
+    "similarity": positional_similarity,
+    "hamming": hamming_distance,
+    "swap": swap_distance,
+    "adjacency": adjacency_overlap,
+}
+
+METRIC_LABELS = {
+    "similarity": "Similarity",
+    "hamming": "Hamming Distance",
+    "swap": "Swap Distance",
+    "adjacency": "Adjacency Overlap",
+}
+
+
+def distance_to(reference, permutations, metric="similarity"):
+    """Metric between a single reference permutation and every row of `permutations`."""
+    permutations = np.asarray(permutations)
+    reference = np.broadcast_to(np.asarray(reference), permutations.shape)
+    return METRICS[metric](reference, permutations)
+
+
+def pairwise_sums(permutations, metric, pair_budget=DEFAULT_PAIR_BUDGET):
+    """
+    Per-row sum of the metric to every other row, over all unordered pairs. Pairs are
+    generated block by block and evaluated in vectorized chunks of at most pair_budget
+    permutation elements.
+    """
+    permutations = np.asarray(permutations)
+    rows, n = permutations.shape
+    sums = np.zeros(rows)
+    block = max(1, pair_budget // max(n * rows, 1))
+    for start in range(0, rows, block):
+        i, j = np.nonzero(
+            np.arange(start, min(start + block, rows))[:, None] < np.arange(rows)
+        )
+        i += start
+        values = METRICS[metric](permutations[i], permutations[j])
+        sums += np.bincount(i, weights=values, minlength=rows)
+        sums += np.bincount(j, weights=values, minlength=rows)
+    return sums
+
+
+def average_distance(permutations, metric="similarity", **kwargs):
+    """
+    Average metric of each permutation to all the other ones (diagonal excluded). The
+    positional similarity uses the tiled agreement engine; other metrics are evaluated
+    pair by pair in vectorized chunks.
+    """
+    rows = len(permutations)
+    if metric == "similarity":
+        return average_similarity(permutations, **kwargs)
+    if rows < 2:
+        return np.full(rows, np.nan)
+    return pairwise_sums(permutations, metric, **kwargs) / (rows - 1)
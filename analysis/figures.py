@@ -0,0 +1,561 @@
+import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.colors import to_rgb
+import matplotlib.gridspec as gridspec
+from matplotlib.ticker import FixedLocator
+
+from .bootstrap import bootstrap_tables
+from .distances import METRIC_LABELS, average_distance, distance_to
+from .profiling import stage
+from .stats import (
+    NON_SEARCH_FUNCTIONS,
+    by_function,
+    distance_table,
+    expected_best_of_k,
+    measure_table,
+    running_mean,
+    running_min,
+    scaled_distance,
+)
+
+FUNCTION_COLORS = {
+    "heuristic": "#000000",  # black
+    "randomWalk": "#ff0000",  # red
+    "randomSearch": "#0000ff",  # blue
+    "localSearchGreedy": "#ffa500",  # orange
+    "simulatedAnnealing": "#008000",  # green
+    "localSearchSteepest": "#800080",  # purple
+    "tabuSearch": "#00ced1",  # dark turquoise
+}
+plt.rcParams.update(
+    {
+        "font.size": 14,
+        "axes.titlesize": 18,
+        "axes.labelsize": 16,
+        "ytick.labelsize": 14,
+        "xtick.labelsize": 14,
+        "legend.fontsize": 14,
+        "figure.titlesize": 20,
+    }
+)
+
+
+DENSITY_THRESHOLD = 20000
+DENSITY_BINS = 200
+
+
+def scatter_or_density(ax, x, y, color, label, jitter=(0, 0), density="auto"):
+    """
+    Draws one solver's points as a jittered scatter, or, when density is True (or "auto"
+    and there are more than DENSITY_THRESHOLD points), as a rasterized 2-D histogram in
+    the solver's colour with log-scaled opacity. Returns a handle usable in legends.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    if density == "auto":
+        density = len(x) > DENSITY_THRESHOLD
+
+    if not density:
+        return ax.scatter(
+            x + np.random.uniform(-jitter[0], jitter[0], size=len(x)),
+            y + np.random.uniform(-jitter[1], jitter[1], size=len(y)),
+            label=label,
+            alpha=0.7,
+            color=color,
+        )
+
+    finite = np.isfinite(x) & np.isfinite(y)
+    counts, x_edges, y_edges = np.histogram2d(x[finite], y[finite], bins=DENSITY_BINS)
+    image = np.zeros(counts.T.shape + (4,))
+    image[..., :3] = to_rgb(color)
+    image[..., 3] = 0.9 * np.log1p(counts.T) / np.log1p(max(counts.max(), 1))
+    ax.imshow(
+        image,
+        origin="lower",
+        extent=(x_edges[0], x_edges[-1], y_edges[0], y_edges[-1]),
+        aspect="auto",
+        interpolation="nearest",
+        rasterized=True,
+    )
+    return ax.scatter([], [], label=label, alpha=0.7, color=color)
+
+
+def savefig(path):
+    """plt.savefig, recorded as its own profiling stage."""
+    with stage("savefig", output=path):
+        plt.savefig(path)
+
+
+def error_bars(table):
+    """
+    Converts a mean/std table or a bootstrap (estimate, low, high) table into
+    {function_name: (instance_sizes, centres, yerr)} for plt.errorbar. A function only
+    spans the instances it has results for, e.g. while a sweep is still running.
+    """
+    bars = {}
+    for function_name, (instance_sizes, columns) in by_function(table).items():
+        if len(columns) == 2:
+            bars[function_name] = (instance_sizes, *columns)
+        else:
+            centres, low, high = (np.array(column) for column in columns)
+            bars[function_name] = (
+                instance_sizes,
+                centres,
+                [centres - low, high - centres],
+            )
+    return bars
+
+
+def distance_by_instance(
+    data_by_instance,
+    optimal_solutions,
+    output_file="average-fitness",
+    only_search=False,
+    interval="std",
+):
+    """
+    Plots the average fitness for each algorithm across all instance sizes, with either
+    standard deviation or 95% bootstrap confidence interval error bars.
+    """
+    plt.figure(figsize=(12, 8))
+    if interval == "bootstrap":
+        table = bootstrap_tables(data_by_instance, optimal_solutions, ["distance"])
+        table = {
+            instance_size: {
+                function_name: values
+                for function_name, values in functions.items()
+                if not (only_search and function_name in NON_SEARCH_FUNCTIONS)
+            }
+            for instance_size, functions in table["distance"].items()
+        }
+    else:
+        table = distance_table(data_by_instance, optimal_solutions, only_search)
+
+    for function_name, (instance_sizes, avg_fitness, error) in error_bars(
+        table
+    ).items():
+        plt.errorbar(
+            instance_sizes,
+            avg_fitness,
+            yerr=error,
+            label=function_name,
+            capsize=5,
+            color=FUNCTION_COLORS.get(function_name, "black"),
+        )
+
+    plt.xlabel("Instance Size")
+    plt.ylabel(
+        "Average Scaled Distance (with 95% CI)"
+        if interval == "bootstrap"
+        else "Average Scaled Distance (with Std Dev)"
+    )
+    plt.legend()
+    plt.grid()
+    plt.tight_layout()
+    savefig(f"plots/{output_file}.png")
+    plt.close()
+
+
+def plot_all_average_measure(
+    data_by_instance, measure, log_scale=False, output_file="average", interval="std"
+):
+    plt.figure(figsize=(12, 8))
+    if interval == "bootstrap":
+        table = bootstrap_tables(data_by_instance, {}, [measure])[measure]
+    else:
+        table = measure_table(data_by_instance, measure)
+
+    x = np.arange(len(data_by_instance.keys()))
+    positions = dict(zip(data_by_instance.keys(), x))
+
+    for function_name, (instance_sizes, avg_times, error) in error_bars(table).items():
+        plt.errorbar(
+            [positions[instance_size] for instance_size in instance_sizes],
+            avg_times,
+            yerr=error,
+            label=function_name,
+            capsize=5,
+            marker="o",
+            linestyle="-",
+            color=FUNCTION_COLORS.get(function_name, "black"),
+        )
+
+    plt.xticks(x, data_by_instance.keys())
+    plt.xlabel("Instance Size")
+    if measure == "time":
+        if log_scale:
+            plt.yscale("log")
+        plt.ylabel("Average time (ms)")
+        ax = plt.gca()
+        yticks = ax.get_yticks()
+        ax.yaxis.set_major_locator(FixedLocator(yticks))
+        ax.set_yticklabels([f"{int(label)} ms" for label in yticks])
+    else:
+        plt.ylabel(f"Average {measure}")
+    plt.legend()
+    plt.grid(axis="y", which="both", linestyle="--", linewidth=0.5)
+    plt.tight_layout()
+    savefig(f"plots/{output_file}-{measure}{'-log' if log_scale else ''}.png")
+    plt.close()
+
+
+def scaled_distance_vs(
+    data_by_instance,
+    optimal_solutions,
+    measure="time",
+    output_file="fitness-vs",
+    density="auto",
+):
+    instance_sizes = list(data_by_instance.keys())
+    fig = plt.figure(figsize=(24, 14))
+    gs = gridspec.GridSpec(3, 4, height_ratios=[6, 6, 1])
+    axes = [fig.add_subplot(gs[i // 4, i % 4]) for i in range(8)]
+
+    all_handles = {}
+
+    for idx, instance_size in enumerate(instance_sizes):
+        if idx >= 8:
+            break
+        ax = axes[idx]
+        functions_data = data_by_instance[instance_size]
+        if instance_size not in optimal_solutions:
+            continue
+        optimal_cost = optimal_solutions[instance_size]["cost"]
+
+        for function_name, runs in functions_data.items():
+            measures = runs[measure]
+            distances = np.abs(runs["cost"] - optimal_cost) / optimal_cost
+
+            sc = scatter_or_density(
+                ax,
+                measures,
+                distances,
+                FUNCTION_COLORS.get(function_name, "black"),
+                function_name,
+                jitter=(0.1, 0.01),
+                density=density,
+            )
+            all_handles[function_name] = sc
+
+        ax.set_title(f"Instance Size: {instance_size}")
+        ax.set_xlabel(measure.capitalize())
+        ax.set_ylabel("Scaled Distance to Optimal Solution")
+        ax.grid()
+
+    for idx in range(len(instance_sizes), 8):
+        fig.delaxes(axes[idx])
+
+    ax_legend = fig.add_subplot(gs[2, :])
+    ax_legend.axis("off")
+    handles = [all_handles[name] for name in sorted(all_handles)]
+    labels = sorted(all_handles)
+    ax_legend.legend(handles, labels, loc="center", ncol=len(handles), fontsize=20)
+
+    plt.tight_layout()
+    savefig(f"plots/{output_file}-{measure}.png")
+    plt.close()
+
+
+def distance_vs_only_search(
+    data_by_instance,
+    optimal_solutions,
+    measure="time",
+    output_file="fitness-vs",
+    density="auto",
+):
+    instance_sizes = list(data_by_instance.keys())
+    fig = plt.figure(figsize=(24, 14))
+    gs = gridspec.GridSpec(3, 4, height_ratios=[6, 6, 1])
+    axes = [fig.add_subplot(gs[i // 4, i % 4]) for i in range(8)]
+
+    all_handles = {}
+
+    for idx, instance_size in enumerate(instance_sizes):
+        if idx >= 8:
+            break
+        ax = axes[idx]
+        functions_data = data_by_instance[instance_size]
+        if instance_size not in optimal_solutions:
+            continue
+        optimal_cost = optimal_solutions[instance_size]["cost"]
+
+        for function_name, runs in functions_data.items():
+            if function_name in ["randomWalk", "randomSearch", "heuristic"]:
+                continue
+
+            measures = runs[measure]
+            distances = np.abs(runs["cost"] - optimal_cost) / optimal_cost
+
+            sc = scatter_or_density(
+                ax,
+                measures,
+                distances,
+                FUNCTION_COLORS.get(function_name, "black"),
+                function_name,
+                jitter=(0.1, 0.01),
+                density=density,
+            )
+            all_handles[function_name] = sc
+
+        ax.set_title(f"Instance Size: {instance_size}")
+        ax.set_xlabel(measure.capitalize())
+        ax.set_ylabel("Scaled Distance to Optimal Solution")
+        ax.grid()
+
+    for idx in range(len(instance_sizes), 8):
+        fig.delaxes(axes[idx])
+
+    ax_legend = fig.add_subplot(gs[2, :])
+    ax_legend.axis("off")
+    handles = [all_handles[name] for name in sorted(all_handles)]
+    labels = sorted(all_handles)
+    ax_legend.legend(handles, labels, loc="center", ncol=len(handles), fontsize=20)
+
+    plt.tight_layout()
+    savefig(f"plots/{output_file}-{measure}-search.png")
+    plt.close()
+
+
+def initial_final(
+    data_by_instance, equal_axis=False, output_file="initial-final.png", density="auto"
+):
+    instance_sizes = list(data_by_instance.keys())
+    fig, axes = plt.subplots(2, 4, figsize=(24, 12))
+    axes = axes.flatten()
+
+    for idx, instance_size in enumerate(instance_sizes):
+        if idx >= len(axes):
+            break
+
+        ax = axes[idx]
+        functions_data = data_by_instance[instance_size]
+
+        all_initial_costs = []
+        all_final_costs = []
+
+        for function_name, runs in functions_data.items():
+            initial_costs = runs["initialSolution"]["cost"]
+            final_costs = runs["finalSolution"]["cost"]
+
+            scatter_or_density(
+                ax,
+                initial_costs,
+                final_costs,
+                FUNCTION_COLORS.get(function_name, "black"),
+                function_name,
+                density=density,
+            )
+            all_initial_costs.append(initial_costs)
+            all_final_costs.append(final_costs)
+
+        if equal_axis:
+            all_costs = np.concatenate(all_initial_costs + all_final_costs)
+            max_cost = all_costs.max()
+            min_cost = all_costs.min()
+            ax.set_xlim(min_cost, max_cost)
+            ax.set_ylim(min_cost, max_cost)
+            ax.set_aspect("equal", adjustable="box")
+            ax.plot(
+                [min_cost, max_cost],
+                [min_cost, max_cost],
+                linestyle="--",
+                color="black",
+                label="y = x",
+            )
+
+        ax.set_title(f"Instance Size: {instance_size}")
+        ax.set_xlabel("Initial Solution Cost")
+        ax.set_ylabel("Final Solution Cost")
+        ax.legend()
+        ax.grid()
+
+    for idx in range(len(instance_sizes), len(axes)):
+        fig.delaxes(axes[idx])
+
+    plt.tight_layout()
+    savefig(
+        f"plots/{output_file}_equal_axis.png"
+        if equal_axis
+        else f"plots/{output_file}.png"
+    )
+    plt.close()
+
+
+def distance_similarity(
+    data_by_instance,
+    optimal_solutions,
+    output_file="similarity",
+    density="auto",
+    metric="similarity",
+):
+    """
+    Plots a scatter plot of solution fitness vs. similarity to the optimal solution, or
+    any other permutation metric from distances.METRICS.
+    """
+    x_jitter = 0.003 if metric in ("similarity", "adjacency") else 0.3
+    instance_sizes = list(data_by_instance.keys())
+    fig, axes = plt.subplots(2, 4, figsize=(24, 12))
+    axes = axes.flatten()
+
+    for idx, instance_size in enumerate(instance_sizes):
+        ax = axes[idx]
+        functions_data = data_by_instance[instance_size]
+        optimal_cost = optimal_solutions[instance_size]["cost"]
+        optimal_solution = optimal_solutions[instance_size]["permutation"]
+
+        for function_name, runs in functions_data.items():
+            distances = scaled_distance(runs["finalSolution"]["cost"], optimal_cost)
+            with stage(
+                f"distance_to[{metric}]",
+                instanceSize=instance_size,
+                functionName=function_name,
+            ):
+                similarities = distance_to(
+                    optimal_solution, runs["finalSolution"]["permutation"], metric
+                )
+            scatter_or_density(
+                ax,
+                similarities,
+                distances,
+                FUNCTION_COLORS.get(function_name, "black"),
+                function_name,
+                jitter=(x_jitter, 0.003),
+                density=density,
+            )
+
+        ax.set_title(f"Instance Size: {instance_size}")
+        ax.set_xlabel(f"{METRIC_LABELS[metric]} to Optimal Solution")
+        ax.set_ylabel("Scaled Distance to Optimal Solution")
+        ax.legend()
+        ax.grid()
+
+    plt.tight_layout()
+    savefig(f"plots/{output_file}.png")
+    plt.close()
+
+
+def distance_average_similarity(
+    data_by_instance,
+    optimal_solutions,
+    output_file="similarity-average",
+    density="auto",
+    metric="similarity",
+):
+    """
+    Plots a scatter plot of solution average similarity (or another metric from
+    distances.METRICS) to the other solutions vs. fitness.
+    """
+    instance_sizes = list(data_by_instance.keys())
+    fig, axes = plt.subplots(2, 4, figsize=(24, 12))
+    axes = axes.flatten()
+
+    for idx, instance_size in enumerate(instance_sizes):
+        if idx >= len(axes):
+            break
+
+        ax = axes[idx]
+        functions_data = data_by_instance[instance_size]
+
+        if instance_size not in optimal_solutions:
+            continue
+
+        optimal_cost = optimal_solutions[instance_size]["cost"]
+
+        for function_name, runs in functions_data.items():
+            with stage(
+                f"average_distance[{metric}]",
+                instanceSize=instance_size,
+                functionName=function_name,
+            ):
+                average_similarities = average_distance(
+                    runs["finalSolution"]["permutation"], metric
+                )
+            distances = scaled_distance(runs["finalSolution"]["cost"], optimal_cost)
+
+            scatter_or_density(
+                ax,
+                average_similarities,
+                distances,
+                FUNCTION_COLORS.get(function_name, "black"),
+                function_name,
+                density=density,
+            )
+
+        ax.set_title(f"Instance Size: {instance_size}")
+        ax.set_xlabel(f"Average {METRIC_LABELS[metric]} to Other Solutions")
+        ax.set_ylabel("Scaled Distance to Optimal Solution")
+        ax.legend()
+        ax.grid()
+
+    plt.tight_layout()
+    savefig(f"plots/{output_file}.png")
+    plt.close()
+
+
+def multi_start_local_search(
+    data_by_instance, optimal_solutions, output_file="multi-start-local-search"
+):
+    """
+    Treats final solutions as multi-start local search results and plots the best (minimum)
+    and average scaled distances for each algorithm, together with the order-independent
+    expected best scaled distance of k starts (dotted).
+    """
+    instance_sizes = list(data_by_instance.keys())
+    fig, axes = plt.subplots(2, 4, figsize=(24, 12))
+    axes = axes.flatten()
+
+    for idx, instance_size in enumerate(instance_sizes):
+        if idx >= len(axes):
+            break
+
+        ax = axes[idx]
+        functions_data = data_by_instance[instance_size]
+
+        if instance_size not in optimal_solutions:
+            continue
+
+        optimal_cost = optimal_solutions[instance_size]["cost"]
+
+        for function_name, runs in functions_data.items():
+            scaled_distances = scaled_distance(
+                runs["finalSolution"]["cost"], optimal_cost
+            )
+            avg_scaled_distances = running_mean(scaled_distances)
+            min_scaled_distances = running_min(scaled_distances)
+
+            ax.plot(
+                range(len(avg_scaled_distances)),
+                avg_scaled_distances,
+                linestyle="--",
+                color=FUNCTION_COLORS.get(function_name, "black"),
+            )
+            ax.plot(
+                range(len(min_scaled_distances)),
+                min_scaled_distances,
+                label=f"{function_name}",
+                linestyle="-",
+                color=FUNCTION_COLORS.get(function_name, "black"),
+            )
+            with stage(
+                "expected_best_of_k",
+                instanceSize=instance_size,
+                functionName=function_name,
+            ):
+                expected_best = expected_best_of_k(scaled_distances)
+            ax.plot(
+                range(len(scaled_distances)),
+                expected_best,
+                linestyle=":",
+                color=FUNCTION_COLORS.get(function_name, "black"),
+            )
+
+        ax.set_title(f"Instance Size: {instance_size}")
+        ax.set_xlabel("Run Index")
+        ax.set_ylabel("Scaled Distance to Optimal Solution")
+        ax.legend()
+        ax.grid()
+
+    plt.subplots_adjust(hspace=0.4, wspace=0.3)
+    plt.tight_layout()
+    savefig(f"plots/{output_file}.png")
+    plt.close()
@@ -0,0 +1,95 @@
+from .cache import group_data, group_initial_final_data
+from .ingest import expand_paths, ingest_files
+from .profiling import stage
+
+COST_TIME_FILE = "results/cost-time-results.txt"
+INITIAL_FINAL_FILE = "results/initial-final.txt"
+DATASETS = ["costTime", "initialFinal", "optimalSolutions"]
+
+_index = {}
+_sources = {
+    "costTime": [COST_TIME_FILE],
+    "initialFinal": [INITIAL_FINAL_FILE],
+    "jobs": 1,
+    "filters": {},
+}
+
+
+def set_sources(
+    cost_time=None, initial_final=None, jobs=1, instance_sizes=None, function_names=None
+):
+    """
+    Selects the results files (paths, glob patterns or partitioned directories) the
+    index is built from, and optionally the only instances and functions to load.
+    Several files of one kind are ingested in `jobs` processes and merged; see ingest.py.
+    """
+    if cost_time:
+        _sources["costTime"] = expand_paths(cost_time)
+    if initial_final:
+        _sources["initialFinal"] = expand_paths(initial_final)
+    _sources["jobs"] = jobs
+    _sources["filters"] = {
+        "instance_sizes": instance_sizes,
+        "function_names": function_names,
+    }
+    _index.clear()
+
+
+def get_sources():
+    """The selected sources and filters, to hand to worker processes."""
+    return dict(_sources)
+
+
+def restore_sources(sources):
+    """
+    Selects sources returned by get_sources() in another process. Pool workers need
+    this unless they are forked: spawned ones re-import the module with the defaults.
+    Datasets already loaded for the same sources (inherited through fork) are kept.
+    """
+    if sources != _sources:
+        _sources.update(sources)
+        _index.clear()
+
+
+def load_dataset(name):
+    """
+    Returns one dataset of the shared index, loading and grouping it on first use.
+    Each results file is parsed at most once per process (and at most once overall
+    while its columnar cache stays valid).
+    """
+    if name not in _index:
+        if name in ("costTime", "optimalSolutions"):
+            table = ingest_files(
+                _sources["costTime"], _sources["jobs"], **_sources["filters"]
+            )
+            with stage("group_data", files=len(_sources["costTime"])):
+                data_by_instance, optimal_solutions = group_data(table)
+            _index["costTime"] = data_by_instance
+            _index["optimalSolutions"] = optimal_solutions
+        elif name == "initialFinal":
+            table = ingest_files(
+                _sources["initialFinal"], _sources["jobs"], **_sources["filters"]
+            )
+            with stage("group_initial_final_data", files=len(_sources["initialFinal"])):
+                _index[name] = group_initial_final_data(table)
+        else:
+            raise ValueError(f"Unknown dataset: {name}")
+    return _index[name]
+
+
+def load_index(names=DATASETS):
+    """
+    Shared in-memory index: instance -> function -> runs for the cost-time and
+    initial-final results, plus the optimal solution of every instance.
+    """
+    return {name: load_dataset(name) for name in names}
+
+
+def update_index(**datasets):
+    """Replaces datasets of the shared index, e.g. with a grouping built in memory."""
+    _index.update(datasets)
+
+
+def reset_index():
+    """Forgets every loaded dataset, so the next access reads the results files again."""
+    _index.clear()
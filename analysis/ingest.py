@@ -0,0 +1,174 @@
+import glob
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .cache import build_cache, cache_is_fresh, load_cached_results
+from .container import is_container
+from .partitions import is_partitioned, load_partitions
+
+
+def expand_paths(patterns):
+    """Result file paths matching any of the given paths or glob patterns, in order."""
+    paths = []
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern)) or [pattern]
+        paths.extend(path for path in matches if path not in paths)
+    return paths
+
+
+def _build_cache(file_path):
+    """Worker: parses one JSONL file into its columnar cache; returns nothing."""
+    build_cache(file_path)
+
+
+def _merge_column(name, tables, pieces, rows):
+    """
+    Gathers one column from several memory-mapped tables into a new array, taking the
+    (table index, start, stop) pieces in order. Permutation columns are padded with -1
+    to the widest file.
+    """
+    columns = [table["columns"][name] for table in tables]
+    if columns[0].ndim == 2:
+        width = max(column.shape[1] for column in columns)
+        merged = np.full((rows, width), -1, dtype=columns[0].dtype)
+    else:
+        merged = np.empty(rows, dtype=columns[0].dtype)
+    row = 0
+    for index, start, stop in pieces:
+        part = columns[index][start:stop]
+        if merged.ndim == 2:
+            merged[row : row + len(part), : part.shape[1]] = part
+        else:
+            merged[row : row + len(part)] = part
+        row += len(part)
+    return merged
+
+
+def merge_tables(tables):
+    """
+    Merges the columnar tables of several results files of the same kind into one table
+    in the load_cached_results format. Groups with the same (instanceSize, functionName)
+    are concatenated in file order; groups keep the order of first appearance. For
+    instances with an optimal solution in several files, the last file wins. No tables
+    give an empty table of no kind.
+    """
+    if not tables:
+        return {
+            "kind": None,
+            "columns": {},
+            "functionNames": [],
+            "groups": [],
+            "optimalSolutions": [],
+        }
+    kinds = {table["kind"] for table in tables}
+    if len(kinds) > 1:
+        raise ValueError(f"Cannot merge results files of different kinds: {kinds}")
+
+    pieces = {}
+    for index, table in enumerate(tables):
+        for instance_size, function_name, start, stop in table["groups"]:
+            pieces.setdefault((instance_size, function_name), []).append(
+                (index, start, stop)
+            )
+
+    groups = []
+    row = 0
+    for (instance_size, function_name), group_pieces in pieces.items():
+        count = sum(stop - start for _, start, stop in group_pieces)
+        groups.append([instance_size, function_name, row, row + count])
+        row += count
+    ordered = [piece for group_pieces in pieces.values() for piece in group_pieces]
+
+    function_names = list(dict.fromkeys(name for _, name, _, _ in groups))
+    columns = {
+        name: _merge_column(name, tables, ordered, row)
+        for name in tables[0]["columns"]
+        if name not in ("instanceSize", "functionName")
+    }
+    columns["instanceSize"] = np.empty(row, dtype=np.int32)
+    columns["functionName"] = np.empty(row, dtype=np.int16)
+    for instance_size, function_name, start, stop in groups:
+        columns["instanceSize"][start:stop] = instance_size
+        columns["functionName"][start:stop] = function_names.index(function_name)
+
+    optimal_solutions = {}
+    for table in tables:
+        optimal_solutions.update(dict(table["optimalSolutions"]))
+    return {
+        "kind": kinds.pop(),
+        "columns": columns,
+        "functionNames": function_names,
+        "groups": groups,
+        "optimalSolutions": list(optimal_solutions.items()),
+    }
+
+
+def restrict_table(table, instance_sizes=None, function_names=None, columns=None):
+    """
+    View of a table limited to some instances, functions and columns, for merge_tables.
+    Optimal solutions are kept for the selected instances only.
+    """
+    groups = [
+        group
+        for group in table["groups"]
+        if (instance_sizes is None or group[0] in instance_sizes)
+        and (function_names is None or group[1] in function_names)
+    ]
+    sizes = {group[0] for group in groups}
+    return {
+        **table,
+        "groups": groups,
+        "columns": {
+            name: column
+            for name, column in table["columns"].items()
+            if columns is None or name in columns
+        },
+        "optimalSolutions": [
+            [size, solution]
+            for size, solution in table["optimalSolutions"]
+            if size in sizes
+        ],
+    }
+
+
+def ingest_files(
+    file_paths, jobs=1, instance_sizes=None, function_names=None, columns=None
+):
+    """
+    Loads many results files as one table. JSONL files whose cache is missing or stale
+    are parsed concurrently in `jobs` worker processes; each worker writes its columns
+    to the file's .npy cache, and the parent memory-maps those columns and concatenates
+    them. Binary containers and partitioned directories are read in the parent only.
+
+    Rows can be limited to some instances and functions, and columns to the given
+    names. Partitioned directories (partitions.py) then only open the matching
+    partitions; other sources are filtered after loading.
+    """
+    file_paths = list(file_paths)
+    filtered = not (
+        instance_sizes is None and function_names is None and columns is None
+    )
+    stale = [
+        path
+        for path in file_paths
+        if not is_partitioned(path)
+        and not is_container(path)
+        and not cache_is_fresh(path)
+    ]
+    if jobs > 1 and len(stale) > 1:
+        with ProcessPoolExecutor(min(jobs, len(stale))) as executor:
+            list(executor.map(_build_cache, stale))
+
+    tables = []
+    for file_path in file_paths:
+        if is_partitioned(file_path):
+            table = load_partitions(file_path, instance_sizes, function_names, columns)
+        else:
+            table = load_cached_results(file_path)
+            if filtered:
+                table = restrict_table(table, instance_sizes, function_names, columns)
+        tables.append(table)
+    if len(tables) == 1 and not filtered:
+        return tables[0]
+    return merge_tables(tables)
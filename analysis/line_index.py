@@ -0,0 +1,192 @@
+import hashlib
+import json
+import os
+import re
+
+import numpy as np
+
+from .cache import cache_dir_for
+
+INDEX_VERSION = 2
+ENTRY_DTYPE = np.dtype(
+    [
+        ("offset", np.int64),
+        ("length", np.int64),
+        ("instanceSize", np.int32),
+        ("functionName", np.int16),
+        ("runs", np.int32),
+    ]
+)
+TAIL_BYTES = 2**16
+_FUNCTION_NAME = re.compile(rb'"functionName"\s*:\s*"([^"]*)"')
+_INSTANCE_SIZE = re.compile(rb'"instanceSize"\s*:\s*(\d+)')
+_TIME = re.compile(rb'"time"\s*:')
+
+
+def _paths(file_path):
+    cache_dir = cache_dir_for(file_path)
+    return (
+        cache_dir,
+        os.path.join(cache_dir, "lines.npy"),
+        os.path.join(cache_dir, "lines.json"),
+    )
+
+
+def _fields(line):
+    """
+    (instanceSize, functionName, runs) of one JSONL record, found without parsing JSON:
+    names and sizes by regex, runs by counting the keys that occur once per run ("time"
+    of BestCost, "initialSolution" of InitialVsFinal). Falls back to json.loads when
+    the regexes miss.
+    """
+    name = _FUNCTION_NAME.search(line)
+    size = _INSTANCE_SIZE.search(line)
+    if name is None or size is None:
+        result = json.loads(line)
+        runs = result.get("bestSolutions") or result.get("initialVsFinals") or []
+        return result["instanceSize"], result["functionName"], len(runs)
+    if b'"initialVsFinals"' in line:
+        runs = line.count(b'"initialSolution"')
+    else:
+        runs = len(_TIME.findall(line))
+    return int(size.group(1)), name.group(1).decode(), runs
+
+
+def _is_complete(line):
+    """True if a line without a newline is a whole JSON record (the file's last one)."""
+    try:
+        json.loads(line)
+    except ValueError:
+        return False
+    return True
+
+
+def _scan(file_path, start, stop, function_names):
+    """
+    Index entries of the complete lines in bytes [start, stop) of a JSONL results file;
+    a last line without a newline counts when it parses as JSON. Returns (entries, end
+    offset of the last complete line).
+    """
+    entries = []
+    offset = start
+    with open(file_path, "rb") as f:
+        f.seek(start)
+        for line in f:
+            if offset + len(line) > stop:
+                break
+            if not line.endswith(b"\n") and not _is_complete(line):
+                break
+            if line.strip():
+                instance_size, name, runs = _fields(line)
+                if name not in function_names:
+                    function_names.append(name)
+                entries.append(
+                    (offset, len(line), instance_size, function_names.index(name), runs)
+                )
+            offset += len(line)
+    return np.array(entries, dtype=ENTRY_DTYPE), offset
+
+
+def tail_digest(file_path, indexed):
+    """Hash of the last TAIL_BYTES before `indexed`, to recognise a file that only grew."""
+    with open(file_path, "rb") as f:
+        f.seek(max(0, indexed - TAIL_BYTES))
+        return hashlib.sha1(f.read(indexed - f.tell())).hexdigest()
+
+
+def _save(cache_dir, entries_path, meta_path, entries, meta):
+    os.makedirs(cache_dir, exist_ok=True)
+    temporary_path = f"{entries_path}.{os.getpid()}.tmp.npy"
+    np.save(temporary_path, entries)
+    os.replace(temporary_path, entries_path)
+    with open(meta_path, "w") as f:
+        json.dump(meta, f)
+
+
+def load_line_index(file_path):
+    """
+    Sidecar index of a JSONL results file: one ENTRY_DTYPE row per record (byte offset,
+    length, instanceSize, functionName code, run count) and the function names.
+
+    The index is kept in the file's cache directory and checked against the file's size
+    and mtime. When the file only grew since it was indexed (the bytes before the indexed
+    end still hash the same), just the appended lines are scanned; any other change
+    rebuilds it. Returns (entries, function_names).
+    """
+    cache_dir, entries_path, meta_path = _paths(file_path)
+    stat = os.stat(file_path)
+    try:
+        with open(meta_path) as f:
+            meta = json.load(f)
+        entries = np.load(entries_path)
+    except (OSError, ValueError):
+        meta, entries = None, None
+
+    if (
+        meta is not None
+        and meta["version"] == INDEX_VERSION
+        and meta["size"] == stat.st_size
+        and meta["mtime_ns"] == stat.st_mtime_ns
+    ):
+        return entries, meta["functionNames"]
+
+    appended = (
+        meta is not None
+        and meta["version"] == INDEX_VERSION
+        and meta["indexed"] <= stat.st_size
+        and tail_digest(file_path, meta["indexed"]) == meta["tail"]
+    )
+    if appended:
+        function_names = meta["functionNames"]
+        new_entries, indexed = _scan(
+            file_path, meta["indexed"], stat.st_size, function_names
+        )
+        entries = np.concatenate([entries, new_entries])
+    else:
+        function_names = []
+        entries, indexed = _scan(file_path, 0, stat.st_size, function_names)
+
+    _save(
+        cache_dir,
+        entries_path,
+        meta_path,
+        entries,
+        {
+            "version": INDEX_VERSION,
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "indexed": indexed,
+            "tail": tail_digest(file_path, indexed),
+            "functionNames": function_names,
+        },
+    )
+    return entries, function_names
+
+
+def select_entries(file_path, instance_sizes=None, function_names=None):
+    """Index entries of the records matching the instance and function filters."""
+    entries, names = load_line_index(file_path)
+    mask = np.ones(len(entries), dtype=bool)
+    if instance_sizes is not None:
+        mask &= np.isin(entries["instanceSize"], list(instance_sizes))
+    if function_names is not None:
+        codes = [names.index(name) for name in function_names if name in names]
+        mask &= np.isin(entries["functionName"], codes)
+    return entries[mask], names
+
+
+def query_lines(file_path, instance_sizes=None, function_names=None):
+    """Raw JSON lines (bytes) of the matching records, read by seeking to each one."""
+    entries, _ = select_entries(file_path, instance_sizes, function_names)
+    with open(file_path, "rb") as f:
+        for offset, length in zip(
+            entries["offset"].tolist(), entries["length"].tolist()
+        ):
+            f.seek(offset)
+            yield f.read(length)
+
+
+def query_results(file_path, instance_sizes=None, function_names=None):
+    """Parsed records matching the filters; only those lines are read and parsed."""
+    for line in query_lines(file_path, instance_sizes, function_names):
+        yield json.loads(line)
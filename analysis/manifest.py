@@ -0,0 +1,83 @@
+import glob
+import hashlib
+import json
+import os
+from functools import lru_cache
+
+import numpy as np
+
+MANIFEST_FILE = "plots/.manifest.json"
+PACKAGE_DIR = os.path.dirname(__file__)
+
+
+def _update(hasher, value):
+    """Feeds a nested dict/array structure into the hasher in a deterministic order."""
+    if isinstance(value, dict):
+        for key in sorted(value, key=repr):
+            hasher.update(repr(key).encode())
+            _update(hasher, value[key])
+    elif isinstance(value, np.ndarray):
+        hasher.update(f"{value.dtype}{value.shape}".encode())
+        hasher.update(np.ascontiguousarray(value).tobytes())
+    else:
+        hasher.update(repr(value).encode())
+
+
+def data_digest(value):
+    """Content hash of a grouped dataset (or any slice of one)."""
+    hasher = hashlib.sha1()
+    _update(hasher, value)
+    return hasher.hexdigest()
+
+
+@lru_cache(maxsize=None)
+def source_digest():
+    """
+    Hash of every module of the package. Plotted values are computed across
+    figures.py, stats.py, bootstrap.py, distances.py, similarity.py and their helpers,
+    so a change to any of them invalidates every figure.
+    """
+    hasher = hashlib.sha1()
+    for path in sorted(glob.glob(os.path.join(PACKAGE_DIR, "*.py"))):
+        hasher.update(os.path.basename(path).encode())
+        with open(path, "rb") as f:
+            hasher.update(f.read())
+    return hasher.hexdigest()
+
+
+def figure_digest(figure, dataset_digests):
+    """
+    Hash of everything that determines a figure: the data it reads, the plotting
+    function, its keyword arguments and the source of the package computing it.
+    """
+    hasher = hashlib.sha1()
+    hasher.update(source_digest().encode())
+    hasher.update(figure.function.encode())
+    hasher.update(json.dumps(figure.kwargs, sort_keys=True).encode())
+    for name in figure.datasets:
+        hasher.update(dataset_digests[name].encode())
+    return hasher.hexdigest()
+
+
+def load_manifest(path=MANIFEST_FILE):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_manifest(manifest, path=MANIFEST_FILE):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+
+
+def stale_figures(figures, digests, manifest):
+    """Figures whose output is missing or was produced from different inputs."""
+    return [
+        figure
+        for figure in figures
+        if manifest.get(figure.output) != digests[figure.output]
+        or not os.path.exists(figure.output)
+    ]
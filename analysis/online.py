@@ -0,0 +1,166 @@
+from collections import defaultdict
+
+import numpy as np
+
+from .partitions import is_partitioned, load_partitions, read_catalog
+from .records import load_records
+from .stats import NON_SEARCH_FUNCTIONS, scaled_distance
+
+MEASURES = ["distance", "cost", "time", "iterations", "evaluations"]
+SKETCH_SIZE = 1024
+
+
+class QuantileSketch:
+    """
+    Fixed-size uniform reservoir sample (Algorithm R) of a stream of values. Quantiles
+    are exact while at most `size` values were seen and approximate afterwards.
+    """
+
+    __slots__ = ["size", "seen", "reservoir", "rng"]
+
+    def __init__(self, size=SKETCH_SIZE, seed=0):
+        self.size = size
+        self.seen = 0
+        self.reservoir = np.empty(size)
+        self.rng = np.random.default_rng(seed)
+
+    def update(self, values):
+        values = np.asarray(values, dtype=np.float64)
+        free = max(0, min(self.size - self.seen, len(values)))
+        self.reservoir[self.seen : self.seen + free] = values[:free]
+        rest = values[free:]
+        if len(rest):
+            positions = self.seen + free + np.arange(1, len(rest) + 1)
+            slots = self.rng.integers(0, positions)
+            kept = slots < self.size
+            # Fancy assignment keeps the last write per slot, as the sequential algorithm.
+            self.reservoir[slots[kept]] = rest[kept]
+        self.seen += len(values)
+
+    def quantile(self, q):
+        return np.quantile(self.reservoir[: min(self.seen, self.size)], q)
+
+
+class RunningStats:
+    """
+    Count, mean, M2 (sum of squared deviations), min and max of a stream of values,
+    updated one batch at a time with the pairwise form of Welford's algorithm.
+    """
+
+    __slots__ = ["count", "mean", "m2", "min", "max", "sketch"]
+
+    def __init__(self, sketch=False):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+        self.sketch = QuantileSketch() if sketch else None
+
+    def update(self, values):
+        values = np.asarray(values, dtype=np.float64)
+        if not len(values):
+            return
+        count = self.count + len(values)
+        batch_mean = values.mean()
+        delta = batch_mean - self.mean
+        self.m2 += ((values - batch_mean) ** 2).sum() + delta**2 * (
+            self.count * len(values) / count
+        )
+        self.mean += delta * len(values) / count
+        self.count = count
+        self.min = min(self.min, values.min())
+        self.max = max(self.max, values.max())
+        if self.sketch is not None:
+            self.sketch.update(values)
+
+    @property
+    def std(self):
+        """Population standard deviation, like np.std."""
+        return np.sqrt(self.m2 / self.count) if self.count else np.nan
+
+
+def _record_batches(file_path, measures, instance_sizes, function_names):
+    """(instance_size, function_name, measure, values) of every record of a JSONL file."""
+    for result in load_records(file_path, instance_sizes, function_names):
+        runs = result.bestSolutions
+        key = (result.instanceSize, result.functionName)
+        for measure in measures:
+            if measure == "distance":
+                if result.optimalSolution is None:
+                    continue
+                values = scaled_distance(
+                    np.fromiter((run.cost for run in runs), dtype=np.int64),
+                    result.optimalSolution.cost,
+                )
+            else:
+                values = np.fromiter(
+                    (getattr(run, measure) for run in runs), dtype=np.int64
+                )
+            yield (*key, measure, values)
+
+
+def _partition_batches(directory, measures, instance_sizes, function_names):
+    """
+    The same batches from a partitioned directory (partitions.py), one matching
+    partition at a time, memory-mapping only the columns the measures need.
+    """
+    columns = {"cost" if measure == "distance" else measure for measure in measures}
+    for partition in read_catalog(directory)["partitions"]:
+        key = (partition["instanceSize"], partition["functionName"])
+        if (instance_sizes is not None and key[0] not in instance_sizes) or (
+            function_names is not None and key[1] not in function_names
+        ):
+            continue
+        table = load_partitions(directory, [key[0]], [key[1]], columns)
+        optimal_solutions = dict(table["optimalSolutions"])
+        for measure in measures:
+            if measure == "distance":
+                if key[0] not in optimal_solutions:
+                    continue
+                values = scaled_distance(
+                    table["columns"]["cost"], optimal_solutions[key[0]]["cost"]
+                )
+            else:
+                values = table["columns"][measure]
+            yield (*key, measure, values)
+
+
+def aggregate_results(
+    file_paths,
+    measures=MEASURES,
+    sketch=False,
+    instance_sizes=None,
+    function_names=None,
+):
+    """
+    Streams one or more cost-time results files (or partitioned directories) and returns
+    {(instance_size, function_name, measure): RunningStats}. Only one record (or
+    partition) is held in memory at a time. "distance" is the scaled distance to the
+    optimum and is skipped for records without one.
+    """
+    if isinstance(file_paths, str):
+        file_paths = [file_paths]
+    aggregates = defaultdict(lambda: RunningStats(sketch))
+    for path in file_paths:
+        batches = _partition_batches if is_partitioned(path) else _record_batches
+        for instance_size, function_name, measure, values in batches(
+            path, measures, instance_sizes, function_names
+        ):
+            aggregates[(instance_size, function_name, measure)].update(values)
+    return dict(aggregates)
+
+
+def aggregate_table(aggregates, measure, only_search=False):
+    """
+    Mean/std table of one measure in the layout of stats.distance_table and
+    stats.measure_table: {instance_size: {function_name: (mean, std)}}.
+    """
+    table = {}
+    for (instance_size, function_name, name), stats in aggregates.items():
+        if name != measure:
+            continue
+        if only_search and function_name in NON_SEARCH_FUNCTIONS:
+            continue
+        table.setdefault(instance_size, {})[function_name] = (stats.mean, stats.std)
+    return table
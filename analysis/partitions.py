@@ -0,0 +1,142 @@
+import json
+import os
+
+import numpy as np
+
+CATALOG_FILE = "catalog.json"
+CATALOG_VERSION = 1
+
+
+def is_partitioned(path):
+    """True if path is a partitioned results directory with a catalog."""
+    return os.path.isfile(os.path.join(path, CATALOG_FILE))
+
+
+def write_partitions(table, directory):
+    """
+    Writes a columnar results table (the load_cached_results format) as one directory
+    per (instanceSize, functionName) partition, <directory>/<n>/<function>/<column>.npy,
+    plus a catalog listing partitions, row counts, columns and optimal solutions.
+    Permutation columns are stored n wide, without padding.
+    """
+    columns = [
+        name
+        for name in table["columns"]
+        if name not in ("instanceSize", "functionName")
+    ]
+    partitions = []
+    for instance_size, function_name, start, stop in table["groups"]:
+        path = os.path.join(str(instance_size), function_name)
+        os.makedirs(os.path.join(directory, path), exist_ok=True)
+        for name in columns:
+            column = table["columns"][name][start:stop]
+            if name.endswith(".permutation"):
+                column = column[:, :instance_size]
+            np.save(os.path.join(directory, path, f"{name}.npy"), column)
+        partitions.append(
+            {
+                "instanceSize": instance_size,
+                "functionName": function_name,
+                "rows": stop - start,
+                "path": path,
+            }
+        )
+
+    catalog = {
+        "version": CATALOG_VERSION,
+        "kind": table["kind"],
+        "columns": columns,
+        "partitions": partitions,
+        "optimalSolutions": table["optimalSolutions"],
+    }
+    with open(os.path.join(directory, CATALOG_FILE), "w") as f:
+        json.dump(catalog, f, indent=1)
+    return catalog
+
+
+def read_catalog(directory):
+    with open(os.path.join(directory, CATALOG_FILE)) as f:
+        return json.load(f)
+
+
+def _empty_table(directory, catalog, names):
+    """
+    Table with no rows, as a filtered JSONL source gives when nothing matches. Columns
+    keep the dtypes (and permutation widths) of the first partition, if any.
+    """
+    first = catalog["partitions"][0]["path"] if catalog["partitions"] else None
+    columns = {
+        name: (
+            np.load(os.path.join(directory, first, f"{name}.npy"), mmap_mode="r")[:0]
+            if first is not None
+            else np.empty((0, 0) if name.endswith(".permutation") else 0, np.int64)
+        )
+        for name in names
+    }
+    columns["instanceSize"] = np.empty(0, dtype=np.int32)
+    columns["functionName"] = np.empty(0, dtype=np.int16)
+    return {
+        "kind": catalog["kind"],
+        "columns": columns,
+        "functionNames": [],
+        "groups": [],
+        "optimalSolutions": [],
+    }
+
+
+def load_partitions(directory, instance_sizes=None, function_names=None, columns=None):
+    """
+    Loads a partitioned results directory as one table in the load_cached_results
+    format, memory-mapping only the partitions whose instance and function pass the
+    filters and only the requested columns (all of them by default). Optimal solutions
+    are kept for the selected instances only; no match gives an empty table.
+    """
+    from .ingest import merge_tables
+
+    catalog = read_catalog(directory)
+    names = [name for name in catalog["columns"] if columns is None or name in columns]
+    selected = [
+        partition
+        for partition in catalog["partitions"]
+        if (instance_sizes is None or partition["instanceSize"] in instance_sizes)
+        and (function_names is None or partition["functionName"] in function_names)
+    ]
+    if not selected:
+        return _empty_table(directory, catalog, names)
+
+    sizes = {partition["instanceSize"] for partition in selected}
+    optimal_solutions = [
+        [size, solution]
+        for size, solution in catalog["optimalSolutions"]
+        if size in sizes
+    ]
+    tables = [
+        {
+            "kind": catalog["kind"],
+            "columns": {
+                name: np.load(
+                    os.path.join(directory, partition["path"], f"{name}.npy"),
+                    mmap_mode="r",
+                )
+                for name in names
+            },
+            "groups": [
+                [
+                    partition["instanceSize"],
+                    partition["functionName"],
+                    0,
+                    partition["rows"],
+                ]
+            ],
+            "optimalSolutions": optimal_solutions,
+        }
+        for partition in selected
+    ]
+    return merge_tables(tables)
+
+
+def partition_results(source_path, directory):
+    """Writes the partitioned layout of a results file; returns the catalog."""
+    from .cache import load_cached_results
+
+    return write_partitions(load_cached_results(source_path), directory)
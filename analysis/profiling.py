@@ -0,0 +1,125 @@
+import cProfile
+import io
+import json
+import pstats
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+
+_records = None
+_stack = []
+_cprofile_output = None
+
+
+def enable():
+    """Starts recording stages (and tracing allocations) for the rest of the process."""
+    global _records
+    _records = []
+    if not tracemalloc.is_tracing():
+        tracemalloc.start()
+
+
+def enabled():
+    return _records is not None
+
+
+def records():
+    return list(_records or [])
+
+
+@contextmanager
+def stage(name, **labels):
+    """
+    Records wall time, CPU time and peak traced memory of the enclosed block under
+    `name` and `labels` (e.g. instanceSize, functionName, output) when profiling is
+    enabled, and does nothing otherwise. Nested stages report their own peak and
+    still count towards the peak of the enclosing ones.
+    """
+    if _records is None:
+        yield
+        return
+
+    current, peak = tracemalloc.get_traced_memory()
+    if _stack:
+        _stack[-1] = max(_stack[-1], peak)
+    tracemalloc.reset_peak()
+    _stack.append(current)
+    wall, cpu = time.perf_counter(), time.process_time()
+    try:
+        yield
+    finally:
+        wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+        peak = max(_stack.pop(), tracemalloc.get_traced_memory()[1])
+        if _stack:
+            _stack[-1] = max(_stack[-1], peak)
+        _records.append(
+            {
+                "stage": name,
+                **labels,
+                "wallSeconds": round(wall, 6),
+                "cpuSeconds": round(cpu, 6),
+                "peakBytes": peak - current,
+                "depth": len(_stack),
+            }
+        )
+
+
+@contextmanager
+def cprofile(output_file, lines=25):
+    """Runs the enclosed block under cProfile, dumping the stats and printing the top."""
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        profiler.dump_stats(output_file)
+        text = io.StringIO()
+        pstats.Stats(profiler, stream=text).sort_stats("cumulative").print_stats(lines)
+        print(text.getvalue())
+        print(f"cProfile stats written to {output_file}")
+
+
+def profile_output(output):
+    """Selects the figure output (e.g. plots/similarity.png) to run under cProfile."""
+    global _cprofile_output
+    _cprofile_output = output
+
+
+def profiled_output():
+    """The figure output selected with profile_output(), or None."""
+    return _cprofile_output
+
+
+def maybe_cprofile(output):
+    """cprofile() for the selected figure output, a no-op context for any other."""
+    if output != _cprofile_output:
+        return nullcontext()
+    return cprofile(f"{output}.prof")
+
+
+def write_records(file_path):
+    with open(file_path, "w") as f:
+        json.dump(records(), f, indent=2)
+
+
+def format_records(entries=None, limit=20):
+    """Short console table of the slowest top-level and nested stages."""
+    entries = sorted(
+        records() if entries is None else entries,
+        key=lambda entry: entry["wallSeconds"],
+        reverse=True,
+    )[:limit]
+    lines = [f"{'wall s':>9}{'cpu s':>9}{'peak MiB':>10}  stage"]
+    for entry in entries:
+        labels = " ".join(
+            f"{key}={value}"
+            for key, value in entry.items()
+            if key not in ("stage", "wallSeconds", "cpuSeconds", "peakBytes", "depth")
+        )
+        lines.append(
+            f"{entry['wallSeconds']:>9.3f}{entry['cpuSeconds']:>9.3f}"
+            f"{entry['peakBytes'] / 2**20:>10.1f}  "
+            f"{'  ' * entry['depth']}{entry['stage']} {labels}".rstrip()
+        )
+    return "\n".join(lines)
@@ -0,0 +1,178 @@
+import os
+
+import numpy as np
+
+DEFAULT_MEMORY_BUDGET = 256 * 2**20
+
+
+def instance_path(instance_size, input_dir="input", extension="dat"):
+    """Path of a Taillard instance as read by Main.kt: input/tai<n>b.<extension>."""
+    return os.path.join(input_dir, f"tai{instance_size}b.{extension}")
+
+
+def parse_instance(file_path):
+    """
+    Parses a .dat instance like FileParser.initializeProblem: n on the first line, the
+    distance matrix on lines 3..n+2 and the flow matrix on lines n+4..2n+3.
+    Returns (distance_matrix, flow_matrix) as int64 arrays.
+    """
+    with open(file_path) as f:
+        lines = f.read().splitlines()
+    n = int(lines[0].strip())
+    distance_matrix = np.array(
+        [line.split() for line in lines[2 : n + 2]], dtype=np.int64
+    )
+    flow_matrix = np.array(
+        [line.split() for line in lines[n + 3 : n + n + 3]], dtype=np.int64
+    )
+    if distance_matrix.shape != (n, n) or flow_matrix.shape != (n, n):
+        raise ValueError(f"Invalid format in: {file_path}")
+    return distance_matrix, flow_matrix
+
+
+def parse_optimal_solution(file_path):
+    """
+    Parses a .sln file like FileParser.parseOptimalSolution: the second non-blank line
+    holds the 1-based optimal permutation. Returns it 0-based, or None if unreadable.
+    """
+    try:
+        with open(file_path) as f:
+            lines = [line for line in f.read().splitlines() if line.strip()]
+        if len(lines) < 2:
+            raise ValueError(f"Invalid format in: {file_path}")
+        return np.array(lines[1].split(), dtype=np.int64) - 1
+    except (OSError, ValueError):
+        return None
+
+
+def _is_fresh(cache_path, source_path):
+    return (
+        os.path.exists(cache_path)
+        and os.stat(cache_path).st_mtime_ns >= os.stat(source_path).st_mtime_ns
+    )
+
+
+def _save_atomic(path, array):
+    """Writes an .npy file under a temporary name first so readers never see it partial."""
+    temporary_path = f"{path}.{os.getpid()}.tmp.npy"
+    np.save(temporary_path, array)
+    os.replace(temporary_path, path)
+
+
+def _compact(matrix):
+    info = np.iinfo(np.int32)
+    if matrix.size and (matrix.min() < info.min or matrix.max() > info.max):
+        return matrix
+    return matrix.astype(np.int32)
+
+
+def load_instance(instance_size, input_dir="input"):
+    """
+    Distance and flow matrices of tai<n>b, memory-mapped from .npy files written next to
+    the .dat file on first use (int32 when the values fit, int64 otherwise). The cache
+    is rewritten whenever the .dat file is newer, so worker processes can share it.
+    """
+    source_path = instance_path(instance_size, input_dir)
+    base = os.path.splitext(source_path)[0]
+    paths = [f"{base}.distance.npy", f"{base}.flow.npy"]
+    if not all(_is_fresh(path, source_path) for path in paths):
+        for path, matrix in zip(paths, parse_instance(source_path)):
+            _save_atomic(path, _compact(matrix))
+    return tuple(np.load(path, mmap_mode="r") for path in paths)
+
+
+def load_optimal_solution(instance_size, input_dir="input"):
+    """
+    0-based optimal permutation of tai<n>b from its .sln file, cached as int32 .npy in
+    the same way as load_instance. Returns None when there is no readable .sln file.
+    """
+    source_path = instance_path(instance_size, input_dir, "sln")
+    cache_path = f"{os.path.splitext(source_path)[0]}.optimal.npy"
+    if not os.path.exists(source_path):
+        return None
+    if not _is_fresh(cache_path, source_path):
+        permutation = parse_optimal_solution(source_path)
+        if permutation is None:
+            return None
+        _save_atomic(cache_path, permutation.astype(np.int32))
+    return np.load(cache_path, mmap_mode="r")
+
+
+def evaluate(
+    permutations, distance_matrix, flow_matrix, memory_budget=DEFAULT_MEMORY_BUDGET
+):
+    """
+    QAP cost of every row of an (R, n) permutation array, as in Solution.evaluate:
+    sum over i, j of flow[p[i]][p[j]] * distance[i][j]. Rows are processed in chunks
+    whose (B, n, n) gathered flow matrices fit in memory_budget bytes.
+    """
+    permutations = np.asarray(permutations, dtype=np.intp)
+    rows, n = permutations.shape
+    batch_size = max(1, memory_budget // (8 * n * n))
+    costs = np.empty(rows, dtype=np.int64)
+    for start in range(0, rows, batch_size):
+        batch = permutations[start : start + batch_size]
+        flows = flow_matrix[batch[:, :, None], batch[:, None, :]]
+        costs[start : start + len(batch)] = np.einsum(
+            "bij,ij->b", flows, distance_matrix, dtype=np.int64
+        )
+    return costs
+
+
+def verify_costs(
+    data_by_instance,
+    optimal_solutions=None,
+    input_dir="input",
+    memory_budget=DEFAULT_MEMORY_BUDGET,
+):
+    """
+    Recomputes the cost of every stored permutation (initial and final solutions of an
+    initial-final grouping, plus optimal solutions) against the instance matrices.
+    Returns one summary dict per checked group, with the indices of drifting runs.
+    """
+    report = []
+    instance_sizes = list(data_by_instance) + [
+        size for size in (optimal_solutions or {}) if size not in data_by_instance
+    ]
+    for instance_size in instance_sizes:
+        path = instance_path(instance_size, input_dir)
+        if not os.path.exists(path):
+            report.append({"instanceSize": instance_size, "error": f"missing {path}"})
+            continue
+        distance_matrix, flow_matrix = load_instance(instance_size, input_dir)
+
+        groups = [
+            (function_name, solution, runs[solution])
+            for function_name, runs in data_by_instance.get(instance_size, {}).items()
+            for solution in ["initialSolution", "finalSolution"]
+        ]
+        if optimal_solutions and instance_size in optimal_solutions:
+            optimal = optimal_solutions[instance_size]
+            groups.append(
+                (
+                    "optimal",
+                    "optimalSolution",
+                    {
+                        "cost": np.array([optimal["cost"]]),
+                        "permutation": np.asarray(optimal["permutation"])[None, :],
+                    },
+                )
+            )
+
+        for function_name, solution, columns in groups:
+            recomputed = evaluate(
+                columns["permutation"], distance_matrix, flow_matrix, memory_budget
+            )
+            drift = np.asarray(columns["cost"], dtype=np.int64) - recomputed
+            drifting = np.flatnonzero(drift)
+            report.append(
+                {
+                    "instanceSize": instance_size,
+                    "functionName": function_name,
+                    "solution": solution,
+                    "checked": len(recomputed),
+                    "drifting": drifting.tolist(),
+                    "maxDrift": int(np.abs(drift).max()) if len(drift) else 0,
+                }
+            )
+    return report
@@ -0,0 +1,38 @@
+import json
+
+from .container import container_records, is_container
+
+
+def load_results(file_path, instance_sizes=None, function_names=None):
+    """
+    Lazily reads a JSONL results file, yielding one parsed record per line.
+    Records whose instanceSize / functionName are not in the given filters are skipped.
+    Binary containers (container.py) yield one record per instance and function. With
+    filters, JSONL files are read through their line index (line_index.py), so only
+    the matching lines are parsed.
+    """
+    instance_sizes = set(instance_sizes) if instance_sizes is not None else None
+    function_names = set(function_names) if function_names is not None else None
+
+    if is_container(file_path):
+        records = container_records(file_path)
+    elif instance_sizes is not None or function_names is not None:
+        from .line_index import query_results
+
+        records = query_results(file_path, instance_sizes, function_names)
+    else:
+        records = _json_lines(file_path)
+
+    for result in records:
+        if instance_sizes is not None and result["instanceSize"] not in instance_sizes:
+            continue
+        if function_names is not None and result["functionName"] not in function_names:
+            continue
+        yield result
+
+
+def _json_lines(file_path):
+    with open(file_path) as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
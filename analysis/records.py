@@ -0,0 +1,113 @@
+import sys
+from array import array
+
+from .reader import load_results
+
+
+class Solution:
+    """A permutation packed as unsigned 16-bit values (array('H')) and its cost."""
+
+    __slots__ = ["permutation", "cost"]
+
+    def __init__(self, permutation, cost):
+        self.permutation = array("H", permutation)
+        self.cost = cost
+
+
+class BestCost:
+    __slots__ = ["cost", "time", "iterations", "evaluations"]
+
+    def __init__(self, cost, time=0, iterations=0, evaluations=0):
+        self.cost = cost
+        self.time = time
+        self.iterations = iterations
+        self.evaluations = evaluations
+
+
+class InitialVsFinal:
+    __slots__ = ["initialSolution", "finalSolution"]
+
+    def __init__(self, initialSolution, finalSolution):
+        self.initialSolution = initialSolution
+        self.finalSolution = finalSolution
+
+
+class GeneralResult:
+    __slots__ = ["functionName", "instanceSize", "optimalSolution", "bestSolutions"]
+
+    def __init__(self, functionName, instanceSize, optimalSolution, bestSolutions):
+        self.functionName = functionName
+        self.instanceSize = instanceSize
+        self.optimalSolution = optimalSolution
+        self.bestSolutions = bestSolutions
+
+
+class InitialVsFinalResult:
+    __slots__ = ["functionName", "instanceSize", "initialVsFinals"]
+
+    def __init__(self, functionName, instanceSize, initialVsFinals):
+        self.functionName = functionName
+        self.instanceSize = instanceSize
+        self.initialVsFinals = initialVsFinals
+
+
+def _solution(solution):
+    return Solution(solution["permutation"], solution["cost"])
+
+
+def _interned_optimal(solution, instance_size, optimal_solutions):
+    """
+    The optimal solution of an instance, shared by every record that repeats it: each
+    cost-time line carries its own copy, which is only kept while it differs.
+    """
+    if solution is None:
+        return None
+    interned = optimal_solutions.get(instance_size)
+    if (
+        interned is None
+        or interned.cost != solution["cost"]
+        or interned.permutation.tolist() != solution["permutation"]
+    ):
+        interned = optimal_solutions[instance_size] = _solution(solution)
+    return interned
+
+
+def compact_record(result, optimal_solutions=None):
+    """
+    Converts one parsed JSON line into a slot-based GeneralResult or InitialVsFinalResult
+    (fields mirror Results.kt). Pass the same `optimal_solutions` dict for every line
+    of a file to share the optimal solution objects between records.
+    """
+    optimal_solutions = {} if optimal_solutions is None else optimal_solutions
+    function_name = sys.intern(result["functionName"])
+    instance_size = result["instanceSize"]
+    if "initialVsFinals" in result:
+        return InitialVsFinalResult(
+            function_name,
+            instance_size,
+            [
+                InitialVsFinal(
+                    _solution(run["initialSolution"]), _solution(run["finalSolution"])
+                )
+                for run in result["initialVsFinals"]
+            ],
+        )
+    return GeneralResult(
+        function_name,
+        instance_size,
+        _interned_optimal(result["optimalSolution"], instance_size, optimal_solutions),
+        [
+            BestCost(run["cost"], run["time"], run["iterations"], run["evaluations"])
+            for run in result["bestSolutions"]
+        ],
+    )
+
+
+def load_records(file_path, instance_sizes=None, function_names=None):
+    """
+    Lazily reads a JSONL results file like reader.load_results, yielding compact
+    records instead of nested dicts. Only one line is held as dicts at a time.
+    """
+    optimal_solutions = {}
+    for result in load_results(file_path, instance_sizes, function_names):
+        yield compact_record(result, optimal_solutions)
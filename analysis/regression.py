@@ -0,0 +1,146 @@
+from math import erfc
+
+import numpy as np
+
+from .stats import scaled_distance
+
+MIN_EFFECT = 0.147
+_erfc = np.frompyfunc(erfc, 1, 1)
+
+
+def _normal_tail(z):
+    """P(Z >= z) of a standard normal, element-wise."""
+    return (_erfc(np.asarray(z, dtype=np.float64) / np.sqrt(2)) / 2).astype(np.float64)
+
+
+def rank_tests(baseline, candidate):
+    """
+    One-sided Mann-Whitney U tests of "candidate is larger than baseline" for many
+    groups at once. `baseline` and `candidate` map the same keys to 1-D samples.
+
+    All groups are ranked in a single sort of (group, value); ties get their average rank
+    and the tie correction of the normal approximation. Returns {key: (cliffs_delta,
+    p_greater, p_less)}, where Cliff's delta = P(candidate > baseline) - P(candidate <
+    baseline) over all pairs (positive means larger, i.e. worse, for our measures).
+    """
+    keys = [key for key in baseline if key in candidate]
+    x = [np.asarray(baseline[key], dtype=np.float64) for key in keys]
+    y = [np.asarray(candidate[key], dtype=np.float64) for key in keys]
+    n1 = np.array([len(values) for values in x])
+    n2 = np.array([len(values) for values in y])
+    sizes = n1 + n2
+    groups = np.repeat(np.arange(len(keys)), sizes)
+    values = np.concatenate([part for pair in zip(x, y) for part in pair] or [[]])
+    is_candidate = np.concatenate(
+        [np.repeat([False, True], [a, b]) for a, b in zip(n1, n2)] or [[]]
+    ).astype(bool)
+
+    order = np.lexsort((values, groups))
+    values, groups, is_candidate = values[order], groups[order], is_candidate[order]
+    starts_group = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+    position = np.arange(len(values)) - starts_group[groups]
+    new_block = np.ones(len(values), dtype=bool)
+    new_block[1:] = (values[1:] != values[:-1]) | (groups[1:] != groups[:-1])
+    block = np.cumsum(new_block) - 1
+    block_start = position[new_block]
+    block_size = np.bincount(block)
+    ranks = block_start[block] + (block_size[block] + 1) / 2
+
+    rank_sums = np.bincount(
+        groups[is_candidate], weights=ranks[is_candidate], minlength=len(keys)
+    )
+    u = rank_sums - n2 * (n2 + 1) / 2
+    ties = np.bincount(
+        groups[new_block], weights=block_size**3 - block_size, minlength=len(keys)
+    )
+    pairs = n1 * n2
+    with np.errstate(divide="ignore", invalid="ignore"):
+        variance = pairs / 12 * ((sizes + 1) - ties / (sizes * (sizes - 1)))
+        sd = np.sqrt(variance)
+        z_greater = (u - pairs / 2 - 0.5) / sd
+        z_less = (pairs / 2 - u - 0.5) / sd
+        delta = 2 * u / pairs - 1
+    testable = (sd > 0) & (pairs > 0)
+    p_greater = np.where(testable, _normal_tail(np.where(testable, z_greater, 0)), 1.0)
+    p_less = np.where(testable, _normal_tail(np.where(testable, z_less, 0)), 1.0)
+    return {
+        key: (float(delta[index]), float(p_greater[index]), float(p_less[index]))
+        for index, key in enumerate(keys)
+    }
+
+
+def holm(p_values):
+    """Holm-Bonferroni adjusted p-values, in the input order."""
+    p_values = np.asarray(p_values, dtype=np.float64)
+    order = np.argsort(p_values)
+    adjusted = np.maximum.accumulate(
+        (len(p_values) - np.arange(len(p_values))) * p_values[order]
+    )
+    result = np.empty_like(p_values)
+    result[order] = np.minimum(adjusted, 1.0)
+    return result
+
+
+def _samples(data_by_instance, optimal_solutions, measure):
+    samples = {}
+    for instance_size, functions_data in data_by_instance.items():
+        for function_name, runs in functions_data.items():
+            if measure == "distance":
+                if instance_size not in optimal_solutions:
+                    continue
+                values = scaled_distance(
+                    runs["cost"], optimal_solutions[instance_size]["cost"]
+                )
+            else:
+                values = runs[measure]
+            samples[(instance_size, function_name)] = values
+    return samples
+
+
+def regression_report(
+    baseline,
+    candidate,
+    measures=("time", "evaluations", "distance"),
+    alpha=0.05,
+    min_effect=MIN_EFFECT,
+):
+    """
+    Compares two grouped cost-time datasets, each a (data_by_instance,
+    optimal_solutions) pair, on every (instance, function, measure) present in both.
+    Lower is better for every measure. A group regresses when the Holm-adjusted
+    one-sided p-value is below alpha and Cliff's delta is at least min_effect (0.147
+    is the conventional "small" effect); "improved" is the mirror image.
+    """
+    entries = []
+    for measure in measures:
+        baseline_samples = _samples(*baseline, measure)
+        candidate_samples = _samples(*candidate, measure)
+        for key, (delta, p_greater, p_less) in rank_tests(
+            baseline_samples, candidate_samples
+        ).items():
+            entries.append(
+                {
+                    "instanceSize": key[0],
+                    "functionName": key[1],
+                    "measure": measure,
+                    "baselineMedian": float(np.median(baseline_samples[key])),
+                    "candidateMedian": float(np.median(candidate_samples[key])),
+                    "cliffsDelta": delta,
+                    "pGreater": p_greater,
+                    "pLess": p_less,
+                }
+            )
+
+    if entries:
+        adjusted = holm(
+            [entry[name] for entry in entries for name in ("pGreater", "pLess")]
+        ).reshape(-1, 2)
+        for entry, (p_greater, p_less) in zip(entries, adjusted):
+            entry["pGreater"], entry["pLess"] = float(p_greater), float(p_less)
+            if p_greater < alpha and entry["cliffsDelta"] >= min_effect:
+                entry["status"] = "REGRESSION"
+            elif p_less < alpha and entry["cliffsDelta"] <= -min_effect:
+                entry["status"] = "improved"
+            else:
+                entry["status"] = "ok"
+    return entries
@@ -0,0 +1,189 @@
+import importlib
+import os
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+from .index import get_sources, load_dataset, restore_sources
+from .manifest import (
+    data_digest,
+    figure_digest,
+    load_manifest,
+    save_manifest,
+    stale_figures,
+)
+from .profiling import maybe_cprofile, profile_output, profiled_output, stage
+
+Figure = namedtuple("Figure", ["output", "function", "datasets", "kwargs"])
+
+COST_TIME_FIGURES = [
+    Figure(
+        "plots/average-fitness.png",
+        "distance_by_instance",
+        ("costTime", "optimalSolutions"),
+        {},
+    ),
+    Figure(
+        "plots/average-fitness-only-search.png",
+        "distance_by_instance",
+        ("costTime", "optimalSolutions"),
+        {"output_file": "average-fitness-only-search", "only_search": True},
+    ),
+    *[
+        Figure(
+            f"plots/average-{measure}{'-log' if log_scale else ''}.png",
+            "plot_all_average_measure",
+            ("costTime",),
+            {"measure": measure, "log_scale": log_scale},
+        )
+        for log_scale in [False, True]
+        for measure in ["time", "iterations", "evaluations"]
+    ],
+    Figure(
+        "plots/average-fitness-ci.png",
+        "distance_by_instance",
+        ("costTime", "optimalSolutions"),
+        {"output_file": "average-fitness-ci", "interval": "bootstrap"},
+    ),
+    *[
+        Figure(
+            f"plots/average-ci-{measure}.png",
+            "plot_all_average_measure",
+            ("costTime",),
+            {"measure": measure, "output_file": "average-ci", "interval": "bootstrap"},
+        )
+        for measure in ["time", "iterations", "evaluations"]
+    ],
+    Figure(
+        "plots/fitness-vs-time.png",
+        "scaled_distance_vs",
+        ("costTime", "optimalSolutions"),
+        {"measure": "time"},
+    ),
+    Figure(
+        "plots/fitness-vs-time-search.png",
+        "distance_vs_only_search",
+        ("costTime", "optimalSolutions"),
+        {"measure": "time"},
+    ),
+    Figure(
+        "plots/fitness-vs-iterations.png",
+        "scaled_distance_vs",
+        ("costTime", "optimalSolutions"),
+        {"measure": "iterations"},
+    ),
+    Figure(
+        "plots/fitness-vs-evaluations.png",
+        "scaled_distance_vs",
+        ("costTime", "optimalSolutions"),
+        {"measure": "evaluations"},
+    ),
+]
+
+INITIAL_FINAL_FIGURES = [
+    Figure(
+        "plots/multi-start-local-search.png",
+        "multi_start_local_search",
+        ("initialFinal", "optimalSolutions"),
+        {},
+    ),
+    Figure(
+        "plots/initial-final.png_equal_axis.png",
+        "initial_final",
+        ("initialFinal",),
+        {"equal_axis": True},
+    ),
+    Figure(
+        "plots/initial-final.png.png",
+        "initial_final",
+        ("initialFinal",),
+        {"equal_axis": False},
+    ),
+    Figure(
+        "plots/similarity.png",
+        "distance_similarity",
+        ("initialFinal", "optimalSolutions"),
+        {},
+    ),
+    Figure(
+        "plots/similarity-average.png",
+        "distance_average_similarity",
+        ("initialFinal", "optimalSolutions"),
+        {},
+    ),
+    Figure(
+        "plots/similarity-swap.png",
+        "distance_similarity",
+        ("initialFinal", "optimalSolutions"),
+        {"output_file": "similarity-swap", "metric": "swap"},
+    ),
+    Figure(
+        "plots/similarity-average-swap.png",
+        "distance_average_similarity",
+        ("initialFinal", "optimalSolutions"),
+        {"output_file": "similarity-average-swap", "metric": "swap"},
+    ),
+]
+
+ALL_FIGURES = COST_TIME_FIGURES + INITIAL_FINAL_FIGURES
+
+
+def figure_functions():
+    """
+    Imports the figure module on first use, forcing the Agg backend, so that commands
+    which never draw do not pay for importing matplotlib.
+    """
+    import matplotlib
+
+    matplotlib.use("Agg")
+    return importlib.import_module(".figures", __package__)
+
+
+def render_figure(figure):
+    """Renders a single figure in the current process and returns its output path."""
+    function = getattr(figure_functions(), figure.function)
+    datasets = [load_dataset(name) for name in figure.datasets]
+    with stage("figure", output=figure.output, function=figure.function):
+        with maybe_cprofile(figure.output):
+            function(*datasets, **figure.kwargs)
+    return figure.output
+
+
+def _init_worker(sources, cprofile_output):
+    restore_sources(sources)
+    profile_output(cprofile_output)
+
+
+def render_figures(figures, jobs=1, force=False):
+    """
+    Renders the figures whose inputs changed since the last run (all of them when
+    force is set), in a pool of `jobs` worker processes when jobs > 1. Datasets are
+    loaded up front so that workers only memory-map the validated caches; workers get
+    the selected sources and filters explicitly, so any start method works.
+    """
+    os.makedirs("plots", exist_ok=True)
+    names = {name for figure in figures for name in figure.datasets}
+    dataset_digests = {name: data_digest(load_dataset(name)) for name in names}
+    digests = {
+        figure.output: figure_digest(figure, dataset_digests) for figure in figures
+    }
+    manifest = load_manifest()
+    stale = figures if force else stale_figures(figures, digests, manifest)
+    print(f"{len(figures) - len(stale)} of {len(figures)} figures up to date")
+
+    try:
+        if jobs > 1 and len(stale) > 1:
+            with ProcessPoolExecutor(
+                min(jobs, len(stale)),
+                initializer=_init_worker,
+                initargs=(get_sources(), profiled_output()),
+            ) as executor:
+                for output in executor.map(render_figure, stale):
+                    manifest[output] = digests[output]
+                    print(output)
+        else:
+            for figure in stale:
+                output = render_figure(figure)
+                manifest[output] = digests[output]
+                print(output)
+    finally:
+        save_manifest(manifest)
@@ -0,0 +1,138 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+DEFAULT_MEMORY_BUDGET = 256 * 2**20
+
+_worker_permutations = None
+
+
+def compact_permutations(permutations):
+    """Stores permutations in the smallest unsigned type that fits (uint8 or uint16)."""
+    permutations = np.asarray(permutations)
+    dtype = np.uint8 if permutations.shape[1] <= 256 else np.uint16
+    return np.ascontiguousarray(permutations, dtype=dtype)
+
+
+def one_hot_positions(permutations):
+    """
+    Encodes an (R, n) permutation array as an (R, n * n) 0/1 matrix with a one at
+    column k * n + p[k] for every position k, so that dot products count agreements.
+    """
+    permutations = np.asarray(permutations)
+    rows, n = permutations.shape
+    encoded = np.zeros((rows, n * n), dtype=np.float32)
+    columns = np.arange(n) * n + permutations
+    encoded[np.arange(rows)[:, None], columns] = 1.0
+    return encoded
+
+
+def block_size(n, memory_budget=DEFAULT_MEMORY_BUDGET):
+    """
+    Number of rows per tile so that everything _tile_stats allocates stays within
+    memory_budget bytes: two float32 one-hot blocks (b, n * n) and their (b, n) intp
+    scatter indices with the float32 (b, b) product, then that product with one (b, b)
+    bool comparison. Solves 4b^2 + (8n^2 + 16n) b <= budget and 5b^2 <= budget for b.
+    """
+    per_row = 8 * n * n + 16 * n
+    by_product = (np.sqrt(per_row**2 + 16 * memory_budget) - per_row) / 8
+    by_histogram = np.sqrt(memory_budget / 5)
+    return max(1, int(min(by_product, by_histogram)))
+
+
+def _tiles(rows, size):
+    starts = range(0, rows, size)
+    return [
+        (i, min(i + size, rows), j, min(j + size, rows))
+        for i in starts
+        for j in starts
+        if j >= i
+    ]
+
+
+def _tile_stats(permutations, tile):
+    """
+    Agreement counts of one upper-triangle tile, reduced to row/column sums and a
+    histogram. Products of 0/1 float32 encodings are exact integers, so the counts stay
+    in the product array: the lower triangle of diagonal tiles is zeroed in place and
+    the histogram is built one agreement value at a time, without any (b, b) copy.
+    """
+    i_start, i_stop, j_start, j_stop = tile
+    n = permutations.shape[1]
+    left = one_hot_positions(permutations[i_start:i_stop])
+    if i_start == j_start:
+        counts = left @ left.T
+    else:
+        counts = left @ one_hot_positions(permutations[j_start:j_stop]).T
+    del left
+
+    histogram = np.zeros(n + 1, dtype=np.int64)
+    if i_start == j_start:
+        for row in range(len(counts)):
+            counts[row, : row + 1] = 0
+        histogram[0] -= len(counts) * (len(counts) + 1) // 2
+    for agreements in range(n + 1):
+        histogram[agreements] += np.count_nonzero(counts == agreements)
+
+    row_sums = counts.sum(axis=1, dtype=np.float64).astype(np.int64)
+    column_sums = counts.sum(axis=0, dtype=np.float64).astype(np.int64)
+    return tile, row_sums, column_sums, histogram
+
+
+def _init_worker(permutations):
+    global _worker_permutations
+    _worker_permutations = permutations
+
+
+def _worker_tile_stats(tile):
+    return _tile_stats(_worker_permutations, tile)
+
+
+def pairwise_similarity_stats(
+    permutations, memory_budget=DEFAULT_MEMORY_BUDGET, processes=None
+):
+    """
+    Computes all-pairs positional agreement without materializing the (R, R) matrix.
+    Returns the per-row sum of similarities to every other row and a histogram where
+    histogram[k] is the number of unordered pairs agreeing on exactly k positions.
+    Tiles are spread over a process pool when processes > 1.
+    """
+    permutations = compact_permutations(permutations)
+    rows, n = permutations.shape
+    row_sums = np.zeros(rows, dtype=np.int64)
+    histogram = np.zeros(n + 1, dtype=np.int64)
+    tiles = _tiles(rows, block_size(n, memory_budget))
+
+    if processes is not None and processes > 1 and len(tiles) > 1:
+        with ProcessPoolExecutor(
+            processes, initializer=_init_worker, initargs=(permutations,)
+        ) as executor:
+            results = list(executor.map(_worker_tile_stats, tiles))
+    else:
+        results = (_tile_stats(permutations, tile) for tile in tiles)
+
+    for (
+        (i_start, i_stop, j_start, j_stop),
+        row_part,
+        column_part,
+        tile_histogram,
+    ) in results:
+        row_sums[i_start:i_stop] += row_part
+        row_sums[j_start:j_stop] += column_part
+        histogram += tile_histogram
+
+    return row_sums / n, histogram
+
+
+def average_similarity(
+    permutations, memory_budget=DEFAULT_MEMORY_BUDGET, processes=None
+):
+    """
+    Average similarity of each permutation to all the other ones (diagonal excluded).
+    Rows are NaN when there is no other permutation to compare with.
+    """
+    rows = len(permutations)
+    if rows < 2:
+        return np.full(rows, np.nan)
+    row_sums, _ = pairwise_similarity_stats(permutations, memory_budget, processes)
+    return row_sums / (rows - 1)
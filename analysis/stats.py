@@ -0,0 +1,138 @@
+import numpy as np
+
+NON_SEARCH_FUNCTIONS = ["randomWalk", "randomSearch", "heuristic"]
+
+
+def scaled_distance(cost, optimal_cost):
+    """Calculates the fitness as (cost - optimal) / optimal."""
+    return (cost - optimal_cost) / optimal_cost
+
+
+def distance_table(data_by_instance, optimal_solutions, only_search=False):
+    """
+    Mean and standard deviation of the scaled distance to the optimum for every
+    instance and function: {instance_size: {function_name: (mean, std)}}.
+    Instances without a known optimum are skipped.
+    """
+    table = {}
+    for instance_size, functions_data in data_by_instance.items():
+        if instance_size not in optimal_solutions:
+            continue
+
+        optimal_value = optimal_solutions[instance_size]["cost"]
+
+        for function_name, runs in functions_data.items():
+            if only_search and function_name in NON_SEARCH_FUNCTIONS:
+                continue
+            distance_values = scaled_distance(runs["cost"], optimal_value)
+            table.setdefault(instance_size, {})[function_name] = (
+                np.mean(distance_values),
+                np.std(distance_values),
+            )
+    return table
+
+
+def measure_table(data_by_instance, measure):
+    """
+    Mean and standard deviation of a run measure (time, iterations, evaluations, cost)
+    for every instance and function: {instance_size: {function_name: (mean, std)}}.
+    """
+    return {
+        instance_size: {
+            function_name: (np.mean(runs[measure]), np.std(runs[measure]))
+            for function_name, runs in functions_data.items()
+        }
+        for instance_size, functions_data in data_by_instance.items()
+    }
+
+
+def by_function(table):
+    """
+    Transposes a table into {function_name: (instance_sizes, ([first values], [second
+    values], ...))} ordered by instance, e.g. ([means], [stds]) for a mean/std table.
+    Each function lists only the instances it has results for.
+    """
+    columns = {}
+    for instance_size, functions in table.items():
+        for function_name, values in functions.items():
+            instance_sizes, lists = columns.setdefault(
+                function_name, ([], tuple([] for _ in values))
+            )
+            instance_sizes.append(instance_size)
+            for column, value in zip(lists, values):
+                column.append(value)
+    return columns
+
+
+def format_table(table, title, precision=4, separator="±"):
+    """
+    Renders a table of (first, second) value pairs as text with one row per instance
+    and one column per function.
+    """
+    function_names = list(
+        dict.fromkeys(name for functions in table.values() for name in functions)
+    )
+    header = ["instance"] + function_names
+    rows = [
+        [str(instance_size)]
+        + [
+            (
+                f"{functions[name][0]:.{precision}g} {separator} "
+                f"{functions[name][1]:.{precision}g}"
+                if name in functions
+                else "-"
+            )
+            for name in function_names
+        ]
+        for instance_size, functions in table.items()
+    ]
+    widths = [max(len(row[i]) for row in [header] + rows) for i in range(len(header))]
+    lines = [title, "  ".join(cell.rjust(width) for cell, width in zip(header, widths))]
+    lines += [
+        "  ".join(cell.rjust(width) for cell, width in zip(row, widths)) for row in rows
+    ]
+    return "\n".join(lines)
+
+
+def running_mean(values):
+    """Mean of every prefix values[: i + 1], computed with a cumulative sum."""
+    values = np.asarray(values, dtype=np.float64)
+    return np.cumsum(values) / np.arange(1, len(values) + 1)
+
+
+def running_min(values):
+    """Minimum of every prefix values[: i + 1]."""
+    return np.minimum.accumulate(np.asarray(values, dtype=np.float64))
+
+
+def _log_binomial(log_factorials, a, b):
+    return log_factorials[a] - log_factorials[b] - log_factorials[a - b]
+
+
+def expected_best_of_k(values, chunk_size=2**22):
+    """
+    Exact expected minimum of k values drawn without replacement from `values`, for
+    every k = 1..R. Independent of the order of the values.
+
+    With x(1) <= ... <= x(R) sorted, E[min of k] = x(1) + sum_i P(min >= x(i)) * (x(i) - x(i-1)),
+    where P(min >= x(i)) = C(R - i + 1, k) / C(R, k).
+    """
+    values = np.sort(np.asarray(values, dtype=np.float64))
+    count = len(values)
+    if count == 0:
+        return values
+    log_factorials = np.concatenate([[0.0], np.cumsum(np.log(np.arange(1, count + 1)))])
+    gaps = np.diff(values)
+    remaining = count - np.arange(1, count)
+
+    expected = np.empty(count)
+    rows = max(1, chunk_size // count)
+    for start in range(0, count, rows):
+        ks = np.arange(start + 1, min(start + rows, count) + 1)[:, None]
+        feasible = remaining >= ks
+        log_survival = _log_binomial(
+            log_factorials, np.where(feasible, remaining, ks), ks
+        ) - _log_binomial(log_factorials, count, ks)
+        survival = np.where(feasible, np.exp(log_survival), 0.0)
+        expected[start : start + len(ks)] = values[0] + survival @ gaps
+    return expected
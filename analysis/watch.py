@@ -0,0 +1,143 @@
+import hashlib
+import json
+import os
+import time
+from collections import defaultdict
+
+import numpy as np
+
+from .cache import MEASURES, _collect_cost_time
+from .index import COST_TIME_FILE, update_index
+from .line_index import TAIL_BYTES, tail_digest
+from .records import compact_record
+
+
+class ResultsTail:
+    """
+    Follows a JSONL results file by byte offset. Each read parses only the complete
+    lines appended since the previous one; a trailing partial line is left for the
+    next read. A file that was rewritten (Main.kt clears it at start-up) is read from
+    the top: it shrank, or the bytes before the offset no longer hash the same, which
+    also catches a cleared file that grew past the old offset between two polls.
+    Records are returned in the compact form of records.py.
+    """
+
+    def __init__(self, file_path):
+        self.file_path = file_path
+        self.offset = 0
+        self.tail = b""
+        self.optimal_solutions = {}
+
+    def read(self):
+        """Returns (records, reset): the new records and whether the file was rewritten."""
+        try:
+            size = os.path.getsize(self.file_path)
+        except OSError:
+            return [], False
+        reset = size < self.offset or (
+            self.offset > 0
+            and tail_digest(self.file_path, self.offset)
+            != hashlib.sha1(self.tail).hexdigest()
+        )
+        if reset:
+            self.offset = 0
+            self.tail = b""
+            self.optimal_solutions = {}
+        if size == self.offset:
+            return [], reset
+
+        with open(self.file_path, "rb") as f:
+            f.seek(self.offset)
+            chunk = f.read(size - self.offset)
+        end = chunk.rfind(b"\n") + 1
+        self.offset += end
+        self.tail = (self.tail + chunk[max(0, end - TAIL_BYTES) : end])[-TAIL_BYTES:]
+        records = [
+            compact_record(json.loads(line), self.optimal_solutions)
+            for line in chunk[:end].splitlines()
+            if line.strip()
+        ]
+        return records, reset
+
+
+class CostTimeGrouping:
+    """
+    In-memory grouping of GeneralResult records in the layout of cache.group_data,
+    updated incrementally: new records are appended only to the groups they belong to.
+    """
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self.data_by_instance = defaultdict(dict)
+        self.optimal_solutions = {}
+
+    def update(self, records):
+        """Adds records and returns the names of the index datasets that changed."""
+        chunks, optimal_solutions = _collect_cost_time(records)
+        changed = set()
+        for (instance_size, function_name), columns in chunks.items():
+            runs = self.data_by_instance[instance_size].get(function_name, {})
+            self.data_by_instance[instance_size][function_name] = {
+                measure: np.concatenate(
+                    [runs.get(measure, np.empty(0, dtype=np.int64))] + columns[measure]
+                )
+                for measure in MEASURES
+            }
+            changed.add("costTime")
+        for instance_size, solution in optimal_solutions.items():
+            if instance_size not in self.optimal_solutions:
+                self.optimal_solutions[instance_size] = {
+                    "permutation": np.asarray(solution["permutation"], dtype=np.int16),
+                    "cost": solution["cost"],
+                }
+                changed.add("optimalSolutions")
+        return changed
+
+
+def watch(file_path=COST_TIME_FILE, figures=None, interval=5.0, polls=None):
+    """
+    Tails a cost-time results file while a benchmark appends to it and, whenever new
+    lines arrive, re-renders the figures that read a dataset they changed. Figures are
+    rendered in this process from the in-memory grouping. Stops after `polls` polls
+    when given, otherwise runs until interrupted.
+    """
+    from .render import COST_TIME_FIGURES, render_figures
+
+    figures = COST_TIME_FIGURES if figures is None else figures
+    tail = ResultsTail(file_path)
+    grouping = CostTimeGrouping()
+    poll = 0
+    while polls is None or poll < polls:
+        if poll:
+            time.sleep(interval)
+        poll += 1
+
+        records, reset = tail.read()
+        if reset:
+            grouping.clear()
+            print(f"{file_path} was rewritten, starting over")
+        changed = grouping.update(records)
+        if reset:
+            changed |= {"costTime", "optimalSolutions"}
+        if not changed:
+            continue
+
+        update_index(
+            costTime=grouping.data_by_instance,
+            optimalSolutions=grouping.optimal_solutions,
+        )
+        affected = [
+            figure for figure in figures if changed.intersection(figure.datasets)
+        ]
+        runs = sum(
+            len(runs["cost"])
+            for functions_data in grouping.data_by_instance.values()
+            for runs in functions_data.values()
+        )
+        print(
+            f"{len(records)} new results ({runs} runs in total), "
+            f"{len(affected)} affected figures"
+        )
+        render_figures(affected)
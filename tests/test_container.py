@@ -0,0 +1,65 @@
+import json
+import struct
+
+import numpy as np
+
+from analysis.benchmark import generate_cost_time, generate_initial_final
+from analysis.cache import load_cached_results
+from analysis.container import (
+    MAGIC,
+    container_records,
+    convert_results,
+    is_container,
+    read_container,
+)
+from analysis.reader import load_results
+
+
+def _header(file_path):
+    with open(file_path, "rb") as f:
+        f.read(len(MAGIC))
+        (size,) = struct.unpack("<I", f.read(4))
+        return json.loads(f.read(size))
+
+
+def _assert_round_trip(source, target):
+    table = load_cached_results(source)
+    restored = read_container(target)
+    for key in ["kind", "functionNames", "groups", "optimalSolutions"]:
+        assert restored[key] == table[key]
+    assert set(restored["columns"]) == set(table["columns"])
+    for name, column in table["columns"].items():
+        assert restored["columns"][name].dtype == column.dtype, name
+        assert np.array_equal(restored["columns"][name], column), name
+
+
+def test_cost_time_round_trip(tmp_path):
+    source, target = str(tmp_path / "results.txt"), str(tmp_path / "results.qapres")
+    generate_cost_time(source, [20, 30], runs=6)
+    for compression in ["lzma", "zlib"]:
+        convert_results(source, target, compression)
+        assert is_container(target) and not is_container(source)
+        stored = {
+            column["name"]: np.dtype(column["storedDtype"])
+            for column in _header(target)["columns"]
+        }
+        assert stored["time"].itemsize < 8
+        _assert_round_trip(source, target)
+        assert list(container_records(target)) == list(load_results(source))
+        # Both loaders detect the container transparently.
+        assert list(load_results(target)) == list(load_results(source))
+
+
+def test_initial_final_round_trip_packs_permutations(tmp_path):
+    for sizes, packed in [([20, 30], "|u1"), ([20, 300], "<u2")]:
+        source = str(tmp_path / f"results-{sizes[-1]}.txt")
+        target = str(tmp_path / f"results-{sizes[-1]}.qapres")
+        generate_initial_final(source, sizes, runs=3)
+        convert_results(source, target)
+        _assert_round_trip(source, target)
+        stored = {
+            column["name"]: column["storedDtype"]
+            for column in _header(target)["columns"]
+        }
+        assert stored["finalSolution.permutation"] == packed
+        assert list(container_records(target)) == list(load_results(source))
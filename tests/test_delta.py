@@ -0,0 +1,102 @@
+import itertools
+
+import numpy as np
+
+from analysis.delta import (
+    audit_permutations,
+    delta_matrices,
+    tabu_miss_probability,
+    tabu_sample_plan,
+)
+
+
+def _cost(permutation, distance_matrix, flow_matrix):
+    return sum(
+        flow_matrix[permutation[i], permutation[j]] * distance_matrix[i, j]
+        for i in range(len(permutation))
+        for j in range(len(permutation))
+    )
+
+
+def _swapped(permutation, r, s):
+    swapped = permutation.copy()
+    swapped[r], swapped[s] = swapped[s], swapped[r]
+    return swapped
+
+
+def _instance(rng, n):
+    return rng.integers(0, 50, (n, n)), rng.integers(0, 50, (n, n))
+
+
+def test_delta_matrices_match_every_swap_on_asymmetric_instances():
+    rng = np.random.default_rng(0)
+    for n in [2, 3, 5, 8]:
+        distance_matrix, flow_matrix = _instance(rng, n)
+        permutations = np.array([rng.permutation(n) for _ in range(4)])
+        deltas = delta_matrices(permutations, distance_matrix, flow_matrix)
+        for permutation, delta in zip(permutations, deltas):
+            cost = _cost(permutation, distance_matrix, flow_matrix)
+            for r, s in itertools.permutations(range(n), 2):
+                swapped = _swapped(permutation, r, s)
+                assert delta[r, s] == (
+                    _cost(swapped, distance_matrix, flow_matrix) - cost
+                )
+            assert not np.diagonal(delta).any()
+
+
+def test_audit_counts_improving_moves_and_best_delta():
+    rng = np.random.default_rng(1)
+    n = 6
+    distance_matrix, flow_matrix = _instance(rng, n)
+    permutations = np.array([rng.permutation(n) for _ in range(7)])
+    improving, best, miss = audit_permutations(
+        permutations, distance_matrix, flow_matrix, memory_budget=1
+    )
+    for permutation, count, improvement in zip(permutations, improving, best):
+        cost = _cost(permutation, distance_matrix, flow_matrix)
+        deltas = [
+            _cost(_swapped(permutation, r, s), distance_matrix, flow_matrix) - cost
+            for r, s in itertools.combinations(range(n), 2)
+        ]
+        assert count == sum(delta < 0 for delta in deltas)
+        assert improvement == min(min(deltas), 0)
+    assert np.isnan(miss).all()
+
+
+def _kotlin_miss(improving_moves, n, sample_size):
+    """Exact miss probability of the first sample_size moves of every outer/inner order."""
+    misses = 0
+    orders = list(itertools.permutations(range(n)))
+    for outer in orders:
+        for inner in orders:
+            moves = [(i, j) for i in outer for j in inner if j > i][:sample_size]
+            misses += not any(move in improving_moves for move in moves)
+    return misses / len(orders) ** 2
+
+
+def test_tabu_miss_probability_follows_the_neighbourhood_order():
+    n = 4
+    for improving_moves, sample_size in [
+        ({(0, 1)}, 2),
+        ({(0, 3), (2, 3)}, 3),
+        ({(1, 2)}, 4),
+        ({(0, 1), (0, 2)}, 1),
+    ]:
+        row_improving = np.zeros((1, n), dtype=np.int64)
+        for i, _ in improving_moves:
+            row_improving[0, i] += 1
+        plan = tabu_sample_plan(n, sample_size, samples=20000)
+        assert np.isclose(
+            tabu_miss_probability(row_improving, plan)[0],
+            _kotlin_miss(improving_moves, n, sample_size),
+            atol=0.01,
+        )
+
+
+def test_tabu_miss_probability_edge_cases():
+    n = 5
+    plan = tabu_sample_plan(n, n * (n - 1) // 2)
+    row_improving = np.array([[0, 0, 0, 0, 0], [0, 1, 0, 1, 0]])
+    miss = tabu_miss_probability(row_improving, plan)
+    assert np.isnan(miss[0])
+    assert miss[1] == 0.0
@@ -0,0 +1,101 @@
+import itertools
+from collections import deque
+
+import numpy as np
+
+from analysis.distances import (
+    adjacency_overlap,
+    average_distance,
+    cycle_counts,
+    hamming_distance,
+    inverse,
+    swap_distance,
+)
+
+
+def _cycles(permutation):
+    seen = set()
+    cycles = 0
+    for start in range(len(permutation)):
+        if start not in seen:
+            cycles += 1
+            element = start
+            while element not in seen:
+                seen.add(element)
+                element = permutation[element]
+    return cycles
+
+
+def _swap_distances(n):
+    """Fewest swaps from the identity to every permutation of n, by breadth-first search."""
+    identity = tuple(range(n))
+    distances = {identity: 0}
+    queue = deque([identity])
+    while queue:
+        permutation = queue.popleft()
+        for r, s in itertools.combinations(range(n), 2):
+            swapped = list(permutation)
+            swapped[r], swapped[s] = swapped[s], swapped[r]
+            swapped = tuple(swapped)
+            if swapped not in distances:
+                distances[swapped] = distances[permutation] + 1
+                queue.append(swapped)
+    return distances
+
+
+def test_inverse_and_cycle_counts():
+    rng = np.random.default_rng(0)
+    for n in [1, 2, 7, 33]:
+        permutations = np.array([rng.permutation(n) for _ in range(20)])
+        inverted = inverse(permutations)
+        for permutation, inverse_row in zip(permutations, inverted):
+            assert np.array_equal(permutation[inverse_row], np.arange(n))
+        assert cycle_counts(permutations).tolist() == [
+            _cycles(permutation) for permutation in permutations
+        ]
+
+
+def test_swap_distance_is_the_fewest_swaps():
+    n = 5
+    distances = _swap_distances(n)
+    permutations = np.array(list(distances))
+    rng = np.random.default_rng(1)
+    references = permutations[rng.integers(0, len(permutations), len(permutations))]
+    for p, q, distance in zip(
+        references, permutations, swap_distance(references, permutations)
+    ):
+        # Relabelling by p^-1 maps the p -> q problem onto identity -> p^-1 o q.
+        assert distance == distances[tuple(np.argsort(p)[q])]
+
+
+def test_hamming_and_adjacency_overlap():
+    rng = np.random.default_rng(2)
+    n = 9
+    p = np.array([rng.permutation(n) for _ in range(30)])
+    q = np.array([rng.permutation(n) for _ in range(30)])
+    assert hamming_distance(p, q).tolist() == [
+        sum(a != b for a, b in zip(row_p, row_q)) for row_p, row_q in zip(p, q)
+    ]
+    for row_p, row_q, overlap in zip(p, q, adjacency_overlap(p, q)):
+        neighbours = {frozenset(pair) for pair in zip(row_q, row_q[1:])}
+        shared = sum(frozenset(pair) in neighbours for pair in zip(row_p, row_p[1:]))
+        assert np.isclose(overlap, shared / (n - 1))
+
+
+def test_average_distance_over_all_other_rows():
+    rng = np.random.default_rng(3)
+    permutations = np.array([rng.permutation(6) for _ in range(11)])
+    for metric, function in [("hamming", hamming_distance), ("swap", swap_distance)]:
+        expected = [
+            np.mean(
+                [
+                    function(row[None, :], other[None, :])[0]
+                    for index, other in enumerate(permutations)
+                    if index != row_index
+                ]
+            )
+            for row_index, row in enumerate(permutations)
+        ]
+        assert np.allclose(
+            average_distance(permutations, metric, pair_budget=20), expected
+        )
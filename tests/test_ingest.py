@@ -0,0 +1,98 @@
+import shutil
+
+import numpy as np
+
+from analysis.benchmark import generate_cost_time, generate_initial_final
+from analysis.cache import load_cached_results
+from analysis.ingest import expand_paths, ingest_files, merge_tables, restrict_table
+from analysis.reader import load_results
+
+MEASURES = ["cost", "time", "iterations", "evaluations"]
+
+
+def _expected_groups(file_paths):
+    groups = {}
+    for path in file_paths:
+        for record in load_results(path):
+            key = (record["instanceSize"], record["functionName"])
+            groups.setdefault(key, []).extend(record["bestSolutions"])
+    return groups
+
+
+def test_merge_concatenates_groups_in_file_order(tmp_path):
+    paths = [str(tmp_path / f"results-{index}.txt") for index in range(3)]
+    generate_cost_time(paths[0], [20, 30], runs=3, seed=0)
+    generate_cost_time(paths[1], [30], runs=5, seed=1)
+    generate_cost_time(paths[2], [20, 40], runs=2, seed=2)
+    assert expand_paths([str(tmp_path / "results-*.txt")]) == paths
+
+    merged = ingest_files(paths)
+    expected = _expected_groups(paths)
+    assert [tuple(group[:2]) for group in merged["groups"]] == list(expected)
+    for instance_size, function_name, start, stop in merged["groups"]:
+        runs = expected[(instance_size, function_name)]
+        for measure in MEASURES:
+            assert merged["columns"][measure][start:stop].tolist() == [
+                run[measure] for run in runs
+            ]
+        assert (merged["columns"]["instanceSize"][start:stop] == instance_size).all()
+        names = merged["functionNames"]
+        assert (
+            merged["columns"]["functionName"][start:stop] == names.index(function_name)
+        ).all()
+
+    # Instance 20 is in the first and last file: the last one wins.
+    optimal_solutions = dict(merged["optimalSolutions"])
+    assert (
+        optimal_solutions[20]
+        == dict(load_cached_results(paths[2])["optimalSolutions"])[20]
+    )
+    assert sorted(optimal_solutions) == [20, 30, 40]
+
+    # Fresh copies, so the caches are built by the worker processes.
+    copies = [str(tmp_path / f"copy-{index}.txt") for index in range(3)]
+    for path, copy in zip(paths, copies):
+        shutil.copyfile(path, copy)
+    parallel = ingest_files(copies, jobs=2)
+    assert parallel["groups"] == merged["groups"]
+    for name, column in merged["columns"].items():
+        assert np.array_equal(parallel["columns"][name], column)
+
+
+def test_merge_pads_permutations_to_the_widest_file(tmp_path):
+    paths = [str(tmp_path / "small.txt"), str(tmp_path / "large.txt")]
+    generate_initial_final(paths[0], [20], runs=2)
+    generate_initial_final(paths[1], [30], runs=2)
+    merged = merge_tables([load_cached_results(path) for path in paths])
+    permutations = merged["columns"]["finalSolution.permutation"]
+    assert permutations.shape == (8, 30)
+    for instance_size, _, start, stop in merged["groups"]:
+        assert (permutations[start:stop, instance_size:] == -1).all()
+        assert np.array_equal(
+            np.sort(permutations[start:stop, :instance_size], axis=1),
+            np.broadcast_to(np.arange(instance_size), (stop - start, instance_size)),
+        )
+
+
+def test_restrict_table_keeps_matching_groups_and_columns(tmp_path):
+    path = str(tmp_path / "results.txt")
+    generate_cost_time(path, [20, 30], runs=3)
+    table = load_cached_results(path)
+    restricted = restrict_table(table, [30], ["tabuSearch", "heuristic"], {"time"})
+    assert [group[:2] for group in restricted["groups"]] == [
+        [30, "heuristic"],
+        [30, "tabuSearch"],
+    ]
+    assert set(restricted["columns"]) == {"time"}
+    assert [size for size, _ in restricted["optimalSolutions"]] == [30]
+
+    merged = merge_tables([restricted])
+    assert merged["columns"]["time"].tolist() == [
+        run["time"]
+        for record in load_results(path, [30], ["tabuSearch", "heuristic"])
+        for run in record["bestSolutions"]
+    ]
+    assert (
+        ingest_files([path], instance_sizes=[30], columns={"time"})["groups"]
+        == ingest_files([path], instance_sizes=[30])["groups"]
+    )
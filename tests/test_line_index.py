@@ -0,0 +1,101 @@
+import json
+import os
+import shutil
+
+import numpy as np
+
+from analysis.benchmark import generate_cost_time, generate_initial_final
+from analysis.cache import cache_dir_for
+from analysis.line_index import load_line_index, query_results
+from analysis.reader import load_results
+
+
+def _lines(tmp_path, generate=generate_cost_time):
+    source = str(tmp_path / "source.txt")
+    generate(source, [20, 30], runs=4)
+    with open(source, "rb") as f:
+        return f.readlines()
+
+
+def _rebuilt(file_path):
+    shutil.rmtree(cache_dir_for(file_path))
+    return load_line_index(file_path)
+
+
+def test_index_matches_the_records(tmp_path):
+    for generate, runs in [
+        (generate_cost_time, "bestSolutions"),
+        (generate_initial_final, "initialVsFinals"),
+    ]:
+        path = str(tmp_path / f"{generate.__name__}.txt")
+        generate(path, [20, 30], runs=4)
+        entries, names = load_line_index(path)
+        records = list(load_results(path))
+        assert [names[code] for code in entries["functionName"]] == [
+            record["functionName"] for record in records
+        ]
+        assert entries["instanceSize"].tolist() == [
+            record["instanceSize"] for record in records
+        ]
+        assert entries["runs"].tolist() == [len(record[runs]) for record in records]
+        with open(path, "rb") as f:
+            data = f.read()
+        for entry, record in zip(entries, records):
+            line = data[entry["offset"] : entry["offset"] + entry["length"]]
+            assert json.loads(line) == record
+
+
+def test_appends_are_indexed_incrementally(tmp_path):
+    lines = _lines(tmp_path)
+    path = str(tmp_path / "results.txt")
+    with open(path, "wb") as f:
+        f.writelines(lines[:3])
+        f.write(lines[3][:60])
+    entries, _ = load_line_index(path)
+    assert len(entries) == 3
+
+    with open(path, "ab") as f:
+        f.write(lines[3][60:])
+        f.writelines(lines[4:])
+    entries, names = load_line_index(path)
+    expected, expected_names = _rebuilt(path)
+    assert np.array_equal(entries, expected) and names == expected_names
+    assert len(entries) == len(lines)
+
+
+def test_rewritten_file_is_reindexed(tmp_path):
+    lines = _lines(tmp_path)
+    path = str(tmp_path / "results.txt")
+    with open(path, "wb") as f:
+        f.writelines(lines[:2])
+    load_line_index(path)
+
+    # Same length up to the old end, so a line still ends at the indexed offset.
+    rewritten = [
+        line.replace(b'"instanceSize":20', b'"instanceSize":30') for line in lines
+    ]
+    with open(path, "wb") as f:
+        f.writelines(rewritten)
+    os.utime(path, ns=(0, 0))
+    entries, names = load_line_index(path)
+    expected, expected_names = _rebuilt(path)
+    assert np.array_equal(entries, expected) and names == expected_names
+    assert set(entries["instanceSize"].tolist()) == {30}
+
+
+def test_filtered_reads_of_loosely_formatted_files(tmp_path):
+    records = [json.loads(line) for line in _lines(tmp_path)]
+    path = str(tmp_path / "results.txt")
+    with open(path, "w") as f:
+        f.write("\n".join(json.dumps(record, indent=None) for record in records))
+
+    selected = list(query_results(path, [30], ["tabuSearch", "heuristic"]))
+    assert selected == [
+        record
+        for record in records
+        if record["instanceSize"] == 30
+        and record["functionName"] in ["tabuSearch", "heuristic"]
+    ]
+    assert list(load_results(path, [20])) == [
+        record for record in records if record["instanceSize"] == 20
+    ]
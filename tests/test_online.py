@@ -0,0 +1,32 @@
+import numpy as np
+
+from analysis.online import QuantileSketch, RunningStats
+
+
+def test_running_stats_match_numpy_over_uneven_batches():
+    rng = np.random.default_rng(0)
+    values = rng.gamma(2.0, 1e6, 1000)
+    stats = RunningStats()
+    for batch in np.split(values, [1, 2, 50, 51, 400, 1000]):
+        stats.update(batch)
+    assert stats.count == len(values)
+    assert np.isclose(stats.mean, np.mean(values))
+    assert np.isclose(stats.std, np.std(values))
+    assert stats.min == values.min() and stats.max == values.max()
+
+
+def test_running_stats_of_one_value_and_of_nothing():
+    stats = RunningStats()
+    assert np.isnan(stats.std)
+    stats.update([7])
+    assert stats.mean == 7 and stats.std == 0
+
+
+def test_quantile_sketch_is_exact_until_full():
+    values = np.random.default_rng(1).normal(size=300)
+    sketch = QuantileSketch(size=300)
+    sketch.update(values[:100])
+    sketch.update(values[100:])
+    assert np.isclose(sketch.quantile(0.5), np.median(values))
+    sketch.update(values)
+    assert sketch.seen == 600 and np.isin(sketch.reservoir, values).all()
@@ -0,0 +1,51 @@
+import numpy as np
+
+from analysis.benchmark import generate_cost_time, generate_initial_final
+from analysis.cache import load_cached_results
+from analysis.ingest import ingest_files, merge_tables, restrict_table
+from analysis.partitions import load_partitions, partition_results
+
+
+def _assert_tables_equal(table, expected):
+    assert table["kind"] == expected["kind"]
+    assert table["groups"] == expected["groups"]
+    assert sorted(table["optimalSolutions"]) == sorted(expected["optimalSolutions"])
+    assert set(table["columns"]) == set(expected["columns"])
+    for name, column in expected["columns"].items():
+        assert np.array_equal(table["columns"][name], column), name
+
+
+def test_partitions_round_trip_with_filters(tmp_path):
+    for generate in [generate_cost_time, generate_initial_final]:
+        source = str(tmp_path / f"{generate.__name__}.txt")
+        directory = str(tmp_path / f"{generate.__name__}.parts")
+        generate(source, [20, 30], runs=4)
+        partition_results(source, directory)
+        table = load_cached_results(source)
+
+        _assert_tables_equal(load_partitions(directory), merge_tables([table]))
+        filtered = load_partitions(directory, [30], ["localSearchGreedy"])
+        _assert_tables_equal(
+            filtered,
+            merge_tables([restrict_table(table, [30], ["localSearchGreedy"])]),
+        )
+
+
+def test_partitions_without_a_match_give_an_empty_table(tmp_path):
+    source = str(tmp_path / "results.txt")
+    directory = str(tmp_path / "results.parts")
+    generate_cost_time(source, [20], runs=4)
+    partition_results(source, directory)
+
+    empty = load_partitions(directory, [999])
+    assert empty["kind"] == "costTime" and empty["groups"] == []
+    assert all(len(column) == 0 for column in empty["columns"].values())
+
+    # A directory without the instance does not abort a multi-source load.
+    other = str(tmp_path / "other.txt")
+    generate_cost_time(other, [30], runs=4)
+    merged = ingest_files([directory, other], instance_sizes=[30])
+    _assert_tables_equal(
+        merged, merge_tables([restrict_table(load_cached_results(other), [30])])
+    )
+    assert merge_tables([])["groups"] == []
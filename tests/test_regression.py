@@ -0,0 +1,50 @@
+from collections import Counter
+from math import erfc, sqrt
+
+import numpy as np
+
+from analysis.regression import holm, rank_tests
+
+
+def _brute_force(x, y):
+    greater = sum(b > a for a in x for b in y)
+    less = sum(b < a for a in x for b in y)
+    u = greater + (len(x) * len(y) - greater - less) / 2
+    pairs = len(x) * len(y)
+    size = len(x) + len(y)
+    ties = sum(t**3 - t for t in Counter(list(x) + list(y)).values())
+    sd = sqrt(pairs / 12 * ((size + 1) - ties / (size * (size - 1))))
+    if sd == 0:
+        return (greater - less) / pairs, 1.0, 1.0
+    return (
+        (greater - less) / pairs,
+        erfc((u - pairs / 2 - 0.5) / sd / sqrt(2)) / 2,
+        erfc((pairs / 2 - u - 0.5) / sd / sqrt(2)) / 2,
+    )
+
+
+def test_rank_tests_match_pairwise_u_and_tie_corrected_variance():
+    rng = np.random.default_rng(0)
+    baseline = {
+        "ties": rng.integers(0, 4, 15),
+        "shifted": rng.normal(size=30),
+        "small": [1, 2],
+        "constant": [3, 3, 3],
+    }
+    candidate = {
+        "ties": rng.integers(1, 5, 11),
+        "shifted": rng.normal(0.8, size=25),
+        "small": [2, 2, 5],
+        "constant": [3, 3],
+        "unmatched": [1, 2, 3],
+    }
+    results = rank_tests(baseline, candidate)
+    assert set(results) == {"ties", "shifted", "small", "constant"}
+    for key, result in results.items():
+        assert np.allclose(result, _brute_force(baseline[key], candidate[key]))
+
+
+def test_holm_adjustment():
+    p_values = [0.01, 0.04, 0.03, 0.2]
+    # Sorted: 4 * 0.01, 3 * 0.03, max(2 * 0.04, 0.09), max(0.2, 0.09)
+    assert np.allclose(holm(p_values), [0.04, 0.09, 0.09, 0.2])
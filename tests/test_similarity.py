@@ -0,0 +1,35 @@
+import numpy as np
+
+from analysis.similarity import average_similarity, pairwise_similarity_stats
+
+
+def _brute_force(permutations):
+    agreements = (permutations[:, None, :] == permutations[None, :, :]).sum(axis=2)
+    upper = np.triu_indices(len(permutations), k=1)
+    return agreements, np.bincount(
+        agreements[upper], minlength=permutations.shape[1] + 1
+    )
+
+
+def test_tiled_stats_match_the_full_agreement_matrix():
+    rng = np.random.default_rng(0)
+    n = 6
+    permutations = np.array([rng.permutation(n) for _ in range(23)])
+    permutations[5] = permutations[2]
+    agreements, histogram = _brute_force(permutations)
+    expected_sums = (agreements.sum(axis=1) - n) / n
+    for memory_budget in [1, 3000, 2**20]:
+        row_sums, tiled_histogram = pairwise_similarity_stats(
+            permutations, memory_budget
+        )
+        assert np.allclose(row_sums, expected_sums)
+        assert np.array_equal(tiled_histogram, histogram)
+
+    assert np.allclose(
+        average_similarity(permutations, memory_budget=3000),
+        expected_sums / (len(permutations) - 1),
+    )
+
+
+def test_average_similarity_of_a_single_run_is_nan():
+    assert np.isnan(average_similarity(np.arange(4)[None, :])).all()
@@ -0,0 +1,31 @@
+import itertools
+
+import numpy as np
+
+from analysis.stats import expected_best_of_k
+
+
+def _brute_force(values):
+    return [
+        np.mean([min(sample) for sample in itertools.combinations(values, k)])
+        for k in range(1, len(values) + 1)
+    ]
+
+
+def test_expected_best_of_k_matches_the_mean_minimum_of_every_subset():
+    rng = np.random.default_rng(0)
+    for values in [
+        [5.0],
+        [3, 1, 2],
+        [4, 4, 1, 4, 2, 2],
+        rng.integers(0, 5, 9),
+        rng.normal(size=10),
+    ]:
+        assert np.allclose(expected_best_of_k(values), _brute_force(list(values)))
+
+
+def test_expected_best_of_k_is_chunk_independent():
+    values = np.random.default_rng(1).gamma(2.0, size=40)
+    assert np.allclose(
+        expected_best_of_k(values, chunk_size=7), expected_best_of_k(values)
+    )
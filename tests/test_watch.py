@@ -0,0 +1,55 @@
+import os
+
+from analysis.benchmark import COST_TIME_FUNCTIONS, generate_cost_time
+from analysis.index import reset_index
+from analysis.render import COST_TIME_FIGURES
+from analysis.watch import ResultsTail, watch
+
+
+def test_watch_renders_a_partially_written_sweep(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    os.makedirs("results")
+    generate_cost_time("results/full.txt", [20, 30], runs=5)
+    with open("results/full.txt") as f:
+        lines = f.readlines()
+    # The second instance only has its first two solvers so far.
+    with open("results/cost-time-results.txt", "w") as f:
+        f.writelines(lines[: len(COST_TIME_FUNCTIONS) + 2])
+
+    try:
+        watch("results/cost-time-results.txt", polls=1)
+    finally:
+        reset_index()
+    for figure in COST_TIME_FIGURES:
+        assert os.path.exists(figure.output)
+
+
+def test_results_tail_restarts_when_the_file_is_rewritten(tmp_path):
+    path = str(tmp_path / "results.txt")
+    generate_cost_time(path, [20, 30], runs=3)
+    with open(path) as f:
+        lines = f.readlines()
+    with open(path, "w") as f:
+        f.writelines(lines[:3])
+    tail = ResultsTail(path)
+    records, reset = tail.read()
+    assert len(records) == 3 and not reset
+
+    # Appended lines, plus a partial one left for the next read.
+    with open(path, "a") as f:
+        f.writelines(lines[3:5])
+        f.write(lines[5][:40])
+    records, reset = tail.read()
+    assert [record.functionName for record in records] == [
+        COST_TIME_FUNCTIONS[3],
+        COST_TIME_FUNCTIONS[4],
+    ]
+
+    # Cleared and rewritten past the old offset between two polls.
+    with open(path, "w") as f:
+        f.writelines(lines[7:])
+    records, reset = tail.read()
+    assert reset
+    assert [(record.instanceSize, record.functionName) for record in records] == [
+        (30, function_name) for function_name in COST_TIME_FUNCTIONS
+    ]